@@ -7,6 +7,40 @@ import sys
 import json
 from jobspy import scrape_jobs
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-keyword substring counts
+
+CONTRACT_KEYWORDS = [
+    'contract', 'contractor', 'contract-to-hire', 'c2h', 'independent contractor',
+    'contract position', 'contract role', 'contracting', 'contract work'
+]
+
+EXCLUDE_KEYWORDS = [
+    'full-time', 'permanent', 'employee', 'w-2 only', 'salary', 'benefits package'
+]
+
+def build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over the keywords"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+CONTRACT_AUTOMATON = build_keyword_automaton(CONTRACT_KEYWORDS)
+EXCLUDE_AUTOMATON = build_keyword_automaton(EXCLUDE_KEYWORDS)
+
+def find_keyword_hits(text, keywords, automaton):
+    """Return every keyword occurrence in the text, including ones nested in longer keywords"""
+    if automaton is None:
+        return [keyword for keyword in keywords for _ in range(text.count(keyword))]
+    return [keyword for _, keyword in automaton.iter(text)]
+
 def analyze_scraped_jobs():
     """Scrape a few jobs and analyze their content for scoring improvement"""
     
@@ -28,48 +62,42 @@ def analyze_scraped_jobs():
     
     print(f"Found {len(jobs)} jobs to analyze")
     
-    for i, job in jobs.iterrows():
+    # Score the whole batch at once on a lowercased title + description column;
+    # the newline keeps a phrase from matching across the title/description join
+    descriptions = jobs['description'].fillna('').astype(str)
+    text = (jobs['title'].fillna('').astype(str) + "\n" + descriptions).str.lower()
+    positive_matches = text.map(lambda t: find_keyword_hits(t, CONTRACT_KEYWORDS, CONTRACT_AUTOMATON))
+    negative_matches = text.map(lambda t: find_keyword_hits(t, EXCLUDE_KEYWORDS, EXCLUDE_AUTOMATON))
+    jobs = jobs.assign(
+        description=descriptions,
+        positive_matches=positive_matches,
+        negative_matches=negative_matches,
+        pos_hits=positive_matches.str.len(),
+        neg_hits=negative_matches.str.len()
+    )
+    
+    for i, job in enumerate(jobs.itertuples(index=False)):
         print(f"\n" + "="*60)
-        print(f"JOB {i+1}: {job.get('title', 'N/A')}")
-        print(f"Company: {job.get('company', 'N/A')}")
-        print(f"Job Type: {job.get('job_type', 'N/A')}")
-        print(f"Salary: ${job.get('min_amount', 'N/A')} - ${job.get('max_amount', 'N/A')} ({job.get('interval', 'N/A')})")
-        print(f"URL: {job.get('job_url', 'N/A')}")
-        
-        # Analyze description for contract keywords
-        description = job.get('description', '').lower()
-        title = job.get('title', '').lower()
-        
-        contract_keywords = [
-            'contract', 'contractor', 'contract-to-hire', 'c2h', 'independent contractor',
-            'contract position', 'contract role', 'contracting', 'contract work'
-        ]
-        
-        exclude_keywords = [
-            'full-time', 'permanent', 'employee', 'w-2 only', 'salary', 'benefits package'
-        ]
+        print(f"JOB {i+1}: {getattr(job, 'title', 'N/A')}")
+        print(f"Company: {getattr(job, 'company', 'N/A')}")
+        print(f"Job Type: {getattr(job, 'job_type', 'N/A')}")
+        print(f"Salary: ${getattr(job, 'min_amount', 'N/A')} - ${getattr(job, 'max_amount', 'N/A')} ({getattr(job, 'interval', 'N/A')})")
+        print(f"URL: {getattr(job, 'job_url', 'N/A')}")
         
         print(f"\nCONTRACT ANALYSIS:")
-        found_positive = []
-        found_negative = []
-        
-        for keyword in contract_keywords:
-            if keyword in description or keyword in title:
-                found_positive.append(keyword)
-        
-        for keyword in exclude_keywords:
-            if keyword in description or keyword in title:
-                found_negative.append(keyword)
+        found_positive = [kw for kw in CONTRACT_KEYWORDS if kw in job.positive_matches]
+        found_negative = [kw for kw in EXCLUDE_KEYWORDS if kw in job.negative_matches]
         
-        print(f"Positive keywords found: {found_positive}")
-        print(f"Negative keywords found: {found_negative}")
+        print(f"Positive keywords found: {found_positive} ({job.pos_hits} hits)")
+        print(f"Negative keywords found: {found_negative} ({job.neg_hits} hits)")
         
         # Rate analysis
-        has_rate = job.get('min_amount') is not None or job.get('max_amount') is not None
+        has_rate = getattr(job, 'min_amount', None) is not None or getattr(job, 'max_amount', None) is not None
         print(f"Has salary/rate info: {has_rate}")
         
         # Description preview
-        desc_preview = (job.get('description', '')[:200] + '...') if len(job.get('description', '')) > 200 else job.get('description', '')
+        description = job.description
+        desc_preview = (description[:200] + '...') if len(description) > 200 else description
         print(f"\nDescription preview: {desc_preview}")
 
 if __name__ == "__main__":
@@ -7,12 +7,20 @@ to ensure they are truly contract positions.
 """
 
 import asyncio
+import hashlib
 import json
+import os
+import shelve
 import sys
 import re
+import time
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import numpy as np
+import orjson
 
 try:
     from crawl4ai import AsyncWebCrawler
@@ -20,35 +28,97 @@ except ImportError:
     print("❌ Error: crawl4ai not installed. Install with: pip install crawl4ai")
     sys.exit(1)
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-keyword substring scans
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # Fall back to the backtracking stdlib engine
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Use the default asyncio event loop
+
+# Fetched page text is cached on disk so reruns skip the network
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.crawl_cache')
+CACHE_TTL_SECONDS = int(os.getenv("CRAWL_CACHE_TTL", "86400"))
+
+# Maximum number of pages fetched at once
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "16"))
+
+# Score weights per feature: contract keyword count, full-time keyword count,
+# job type flag, hourly rate present, duration present
+CONFIDENCE_WEIGHTS = (0.2, -0.15, 0.4, 0.2, 0.1)
+# Query parameters that only track the visit and never change the page
+TRACKING_PARAMS = frozenset({'gclid', 'fbclid'})
+
+# Whitespace that stdlib re's Unicode \s matches but RE2's ASCII-only \s does not
+# (NBSP is common on scraped pages); folded to a plain space before extraction
+# so both engines see the same text
+UNICODE_SPACE_TABLE = str.maketrans(dict.fromkeys(
+    '\v\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+    '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000', ' '
+))
+
+CONTRACT_JOB_TYPE_TERMS = ('contract', 'temporary', 'freelance')
+FULL_TIME_JOB_TYPE_TERMS = ('full-time', 'permanent')
+
+@dataclass(slots=True)
 class JobVerificationResult:
     url: str
     is_accessible: bool
     is_contract_job: bool
     confidence_score: float
     job_type_found: Optional[str]
-    contract_indicators: List[str]
-    full_time_indicators: List[str]
+    contract_indicators: Tuple[str, ...]
+    full_time_indicators: Tuple[str, ...]
     hourly_rate: Optional[str]
     duration: Optional[str]
     error_message: Optional[str]
-    content_preview: str
+    content_preview: str = ""  # Only filled in debug mode; never written to the JSON output
 
 class Crawl4AIJobVerifier:
-    def __init__(self):
-        self.contract_keywords = [
+    # Literals every job-type/rate/duration pattern needs; cheap probes before the regex
+    _JOB_TYPE_TRIGGERS = ('type',)
+    _HOURLY_RATE_TRIGGERS = ('hr', 'hour')
+    _DURATION_TRIGGERS = ('month', 'week', 'term', 'duration')
+    
+    # Pages are lowercased this many characters at a time for keyword matching
+    _SCAN_WINDOW = 1 << 16
+
+    # Upper bound on the debug content preview, in UTF-8 bytes
+    _PREVIEW_BYTES = 200
+
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+        
+        # Interned so indicator tuples across results share the same strings
+        self.contract_keywords = tuple(sys.intern(kw) for kw in [
             'contract', 'contractor', 'contract-to-hire', 'c2h', 
             'independent contractor', 'contract position', 'contract role', 
             'contracting', 'contract work', 'freelance', 'consultant',
             'temporary', 'temp', '1099', 'w2 contract', 'project-based'
-        ]
+        ])
         
-        self.full_time_keywords = [
+        self.full_time_keywords = tuple(sys.intern(kw) for kw in [
             'full-time', 'full time', 'permanent position', 'permanent employee',
             'employee benefits', 'health insurance', '401k', 'pto', 'paid time off',
             'vacation days', 'sick leave', 'parental leave', 'dental insurance',
             'vision insurance', 'life insurance', 'disability insurance'
-        ]
+        ])
+        
+        # Every literal looked for on a page: keywords plus regex triggers
+        self.scan_terms = tuple(dict.fromkeys(
+            self.contract_keywords + self.full_time_keywords
+            + self._JOB_TYPE_TRIGGERS + self._HOURLY_RATE_TRIGGERS + self._DURATION_TRIGGERS
+        ))
+        
+        # Single automaton over all scan terms, built once per verifier
+        self.keyword_automaton = self._build_keyword_automaton()
         
         self.job_type_patterns = [
             r'job\s*type\s*:?\s*([^,.\n]+)',
@@ -58,95 +128,88 @@ class Crawl4AIJobVerifier:
         ]
         
         self.hourly_rate_patterns = [
-            r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)',
-            r'\$(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)',
-            r'(\d+(?:\.\d{2})?)\s*-\s*(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)',
-            r'(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)'
+            r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)',
+            r'\$(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)',
+            r'(\d+(?:\.\d{2})?)\s*-\s*(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)',
+            r'(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)'
         ]
+        
+        self.duration_patterns = [
+            r'(\d+)\s*(month|months)',
+            r'(\d+)\s*(week|weeks)',
+            r'(\d+)\s*-\s*(\d+)\s*(month|months)',
+            r'(short\s*term|long\s*term)',
+            r'duration\s*:?\s*([^,.\n]+)'
+        ]
+        
+        # Compiled once; each list is tried in order and the first pattern that matches wins
+        self._job_type_res = self._compile_patterns(self.job_type_patterns)
+        self._hourly_rate_res = self._compile_patterns(self.hourly_rate_patterns)
+        self._duration_res = self._compile_patterns(self.duration_patterns)
 
-    async def verify_job_url(self, url: str) -> JobVerificationResult:
+    async def verify_job_url(self, url: str, crawler: AsyncWebCrawler,
+                             cache: Optional[shelve.Shelf] = None) -> JobVerificationResult:
         """Verify if a job URL contains a contract position"""
+        cache_key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        if cache is not None:
+            hit = cache.get(cache_key)
+            if hit and time.time() - hit['ts'] < CACHE_TTL_SECONDS:
+                return self._analyze_content(url, hit['text'])
+        
         try:
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    word_count_threshold=10,
-                    extraction_strategy="NoExtractionStrategy",
-                    bypass_cache=True
-                )
-                
-                if not result.success:
-                    return JobVerificationResult(
-                        url=url,
-                        is_accessible=False,
-                        is_contract_job=False,
-                        confidence_score=0.0,
-                        job_type_found=None,
-                        contract_indicators=[],
-                        full_time_indicators=[],
-                        hourly_rate=None,
-                        duration=None,
-                        error_message=f"Failed to fetch: {result.status_code}",
-                        content_preview=""
-                    )
-                
-                # Analyze the content
-                content = result.cleaned_html or result.html or ""
-                markdown_content = result.markdown or ""
-                
-                # Use markdown if available, otherwise use cleaned HTML
-                text_content = markdown_content if markdown_content else content
-                
-                return self._analyze_content(url, text_content)
-                
-        except Exception as e:
-            return JobVerificationResult(
+            # Missed or expired in our cache: refetch rather than read Crawl4AI's cache, which never expires
+            result = await crawler.arun(
                 url=url,
-                is_accessible=False,
-                is_contract_job=False,
-                confidence_score=0.0,
-                job_type_found=None,
-                contract_indicators=[],
-                full_time_indicators=[],
-                hourly_rate=None,
-                duration=None,
-                error_message=str(e),
-                content_preview=""
+                word_count_threshold=10,
+                extraction_strategy="NoExtractionStrategy",
+                bypass_cache=True
             )
+            
+            if not result.success:
+                return self._empty_result(url, f"Failed to fetch: {result.status_code}")
+            
+            # Analyze the content
+            content = result.cleaned_html or result.html or ""
+            markdown_content = result.markdown or ""
+            
+            # Use markdown if available, otherwise use cleaned HTML
+            text_content = markdown_content if markdown_content else content
+            if not text_content:
+                return self._empty_result(url, "No content extracted", accessible=True)
+            
+            if cache is not None:
+                cache[cache_key] = {'text': text_content, 'ts': time.time()}
+            
+            return self._analyze_content(url, text_content)
+            
+        except Exception as e:
+            return self._empty_result(url, str(e))
 
     def _analyze_content(self, url: str, content: str) -> JobVerificationResult:
         """Analyze job content to determine if it's a contract position"""
         if not content:
-            return JobVerificationResult(
-                url=url,
-                is_accessible=True,
-                is_contract_job=False,
-                confidence_score=0.0,
-                job_type_found=None,
-                contract_indicators=[],
-                full_time_indicators=[],
-                hourly_rate=None,
-                duration=None,
-                error_message="No content extracted",
-                content_preview=""
-            )
+            return self._empty_result(url, "No content extracted", accessible=True)
         
-        text = content.lower()
+        # Find contract and full-time indicators, plus which regex triggers occur
+        contract_indicators, full_time_indicators, found_terms = self._find_indicators(content)
         
-        # Find contract indicators
-        contract_indicators = [kw for kw in self.contract_keywords if kw in text]
-        
-        # Find full-time indicators
-        full_time_indicators = [kw for kw in self.full_time_keywords if kw in text]
+        # Extractors see Unicode whitespace as plain spaces, whichever engine is in use
+        text = content.translate(UNICODE_SPACE_TABLE)
         
         # Extract job type if explicitly mentioned
-        job_type_found = self._extract_job_type(text)
+        job_type_found = None
+        if any(t in found_terms for t in self._JOB_TYPE_TRIGGERS):
+            job_type_found = self._extract_job_type(text)
         
         # Extract hourly rate
-        hourly_rate = self._extract_hourly_rate(text)
+        hourly_rate = None
+        if any(t in found_terms for t in self._HOURLY_RATE_TRIGGERS):
+            hourly_rate = self._extract_hourly_rate(text)
         
         # Extract duration
-        duration = self._extract_duration(text)
+        duration = None
+        if any(t in found_terms for t in self._DURATION_TRIGGERS):
+            duration = self._extract_duration(text)
         
         # Calculate confidence score
         confidence_score = self._calculate_confidence_score(
@@ -156,8 +219,13 @@ class Crawl4AIJobVerifier:
         # Determine if it's a contract job
         is_contract_job = confidence_score > 0.5
         
-        # Create content preview (first 200 chars)
-        content_preview = content[:200] + "..." if len(content) > 200 else content
+        # Keep a short preview only when debugging, capped in bytes
+        content_preview = ""
+        if self.debug:
+            head = content[:self._PREVIEW_BYTES].encode('utf-8')[:self._PREVIEW_BYTES]
+            content_preview = head.decode('utf-8', 'ignore')
+            if len(content_preview) < len(content):
+                content_preview += "..."
         
         return JobVerificationResult(
             url=url,
@@ -173,97 +241,231 @@ class Crawl4AIJobVerifier:
             content_preview=content_preview
         )
 
-    def _extract_job_type(self, text: str) -> Optional[str]:
-        """Extract explicitly mentioned job type"""
-        for pattern in self.job_type_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over every scan term"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for term in self.scan_terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return automaton
+
+    def _find_indicators(self, content: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], set]:
+        """Find contract and full-time keywords and every scan term present
+        
+        Content is lowercased one window at a time rather than copied whole.
+        Windows overlap by the longest term so matches across a boundary are
+        still seen.
+        """
+        overlap = max(map(len, self.scan_terms)) - 1
+        found = set()
+        for start in range(0, len(content), self._SCAN_WINDOW):
+            window = content[start:start + self._SCAN_WINDOW + overlap].lower()
+            if self.keyword_automaton is None:
+                found.update(term for term in self.scan_terms if term in window)
+            else:
+                found.update(term for _, term in self.keyword_automaton.iter(window))
+        
+        # Preserve keyword-list order so output matches the linear scan
+        return (
+            tuple(kw for kw in self.contract_keywords if kw in found),
+            tuple(kw for kw in self.full_time_keywords if kw in found),
+            found
+        )
+
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> tuple:
+        """Compile each pattern case-insensitively, keeping list order"""
+        if re2 is not None:
+            # RE2 matches in linear time; its \d and \s are ASCII-only
+            return tuple(re2.compile("(?i)" + p) for p in patterns)
+        # ASCII classes keep stdlib matches identical to RE2's
+        return tuple(re.compile(p, re.IGNORECASE | re.ASCII) for p in patterns)
+
+    @staticmethod
+    def _first_match(patterns: tuple, text: str):
+        """Return the match of the first pattern that matches anywhere in the text"""
+        for pattern in patterns:
+            match = pattern.search(text)
             if match:
-                return match.group(1).strip()
+                return match
         return None
 
+    def _extract_job_type(self, text: str) -> Optional[str]:
+        """Extract explicitly mentioned job type"""
+        match = self._first_match(self._job_type_res, text)
+        return match.group(1).strip().lower() if match else None
+
     def _extract_hourly_rate(self, text: str) -> Optional[str]:
         """Extract hourly rate information"""
-        for pattern in self.hourly_rate_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        return None
+        match = self._first_match(self._hourly_rate_res, text)
+        return match.group(0).lower() if match else None
 
     def _extract_duration(self, text: str) -> Optional[str]:
         """Extract contract duration information"""
-        duration_patterns = [
-            r'(\d+)\s*(month|months)',
-            r'(\d+)\s*(week|weeks)',
-            r'(\d+)\s*-\s*(\d+)\s*(month|months)',
-            r'(short\s*term|long\s*term)',
-            r'duration\s*:?\s*([^,.\n]+)'
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        return None
+        match = self._first_match(self._duration_res, text)
+        return match.group(0).lower() if match else None
 
-    def _calculate_confidence_score(self, contract_indicators: List[str], 
-                                  full_time_indicators: List[str],
+    def _calculate_confidence_score(self, contract_indicators: Tuple[str, ...], 
+                                  full_time_indicators: Tuple[str, ...],
                                   job_type_found: Optional[str],
                                   hourly_rate: Optional[str],
                                   duration: Optional[str]) -> float:
         """Calculate confidence score for contract job classification"""
-        score = 0.0
-        
-        # Contract keywords boost
-        score += len(contract_indicators) * 0.2
-        
-        # Full-time keywords penalty
-        score -= len(full_time_indicators) * 0.15
-        
-        # Job type explicit mention
-        if job_type_found:
-            job_type_lower = job_type_found.lower()
-            if any(kw in job_type_lower for kw in ['contract', 'temporary', 'freelance']):
-                score += 0.4
-            elif any(kw in job_type_lower for kw in ['full-time', 'permanent']):
-                score -= 0.4
-        
-        # Hourly rate indication
-        if hourly_rate:
-            score += 0.2
-        
-        # Duration indication
-        if duration:
-            score += 0.1
-        
-        # Normalize to 0-1 range
-        return max(0.0, min(1.0, score))
+        return score_features(confidence_features(
+            contract_indicators, full_time_indicators, job_type_found, hourly_rate, duration
+        ))
 
     async def verify_multiple_jobs(self, urls: List[str]) -> List[JobVerificationResult]:
-        """Verify multiple job URLs concurrently"""
-        tasks = [self.verify_job_url(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """Verify multiple job URLs concurrently through one shared crawler"""
+        semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+        
+        with shelve.open(CACHE_PATH) as cache:
+            async with AsyncWebCrawler(verbose=False) as crawler:
+                async def verify_bounded(url: str) -> JobVerificationResult:
+                    async with semaphore:
+                        return await self.verify_job_url(url, crawler, cache)
+                
+                results = await asyncio.gather(
+                    *(verify_bounded(url) for url in urls), return_exceptions=True
+                )
         
         verified_results = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                verified_results.append(JobVerificationResult(
-                    url=urls[i],
-                    is_accessible=False,
-                    is_contract_job=False,
-                    confidence_score=0.0,
-                    job_type_found=None,
-                    contract_indicators=[],
-                    full_time_indicators=[],
-                    hourly_rate=None,
-                    duration=None,
-                    error_message=str(result),
-                    content_preview=""
-                ))
+                verified_results.append(self._empty_result(urls[i], str(result)))
             else:
                 verified_results.append(result)
         
         return verified_results
 
+    async def verify_stream(self, urls: List[str], out_queue: asyncio.Queue,
+                            concurrency: int = CRAWL_CONCURRENCY) -> None:
+        """Verify job URLs with a fixed worker pool, emitting results as they finish
+        
+        Results are put on out_queue in completion order, followed by a final
+        None once every URL has been processed.
+        """
+        in_queue = asyncio.Queue(maxsize=concurrency * 2)
+        
+        try:
+            with shelve.open(CACHE_PATH) as cache:
+                async with AsyncWebCrawler(verbose=False) as crawler:
+                    async def worker():
+                        while (url := await in_queue.get()) is not None:
+                            try:
+                                result = await self.verify_job_url(url, crawler, cache)
+                            except Exception as e:
+                                result = self._empty_result(url, str(e))
+                            await out_queue.put(result)
+                    
+                    async with asyncio.TaskGroup() as tg:
+                        for _ in range(concurrency):
+                            tg.create_task(worker())
+                        for url in urls:
+                            await in_queue.put(url)
+                        for _ in range(concurrency):
+                            await in_queue.put(None)
+        finally:
+            # Always signal completion so the consumer never waits forever
+            await out_queue.put(None)
+
+    @staticmethod
+    def _empty_result(url: str, reason: str, accessible: bool = False) -> JobVerificationResult:
+        """Build the result for a page that could not be analyzed"""
+        return JobVerificationResult(
+            url=url,
+            is_accessible=accessible,
+            is_contract_job=False,
+            confidence_score=0.0,
+            job_type_found=None,
+            contract_indicators=(),
+            full_time_indicators=(),
+            hourly_rate=None,
+            duration=None,
+            error_message=reason
+        )
+
+def job_type_flag(job_type_found: Optional[str]) -> int:
+    """Classify an extracted job type as contract (1), full-time (-1) or neither (0)"""
+    if job_type_found:
+        job_type_lower = job_type_found.lower()
+        if any(kw in job_type_lower for kw in CONTRACT_JOB_TYPE_TERMS):
+            return 1
+        if any(kw in job_type_lower for kw in FULL_TIME_JOB_TYPE_TERMS):
+            return -1
+    return 0
+
+def confidence_features(contract_indicators: Tuple[str, ...],
+                        full_time_indicators: Tuple[str, ...],
+                        job_type_found: Optional[str],
+                        hourly_rate: Optional[str],
+                        duration: Optional[str]) -> Tuple[int, int, int, int, int]:
+    """Reduce an analyzed page to the integer features the score is built from"""
+    return (
+        len(contract_indicators),
+        len(full_time_indicators),
+        job_type_flag(job_type_found),
+        1 if hourly_rate else 0,
+        1 if duration else 0
+    )
+
+def score_features(features: Tuple[int, ...],
+                   weights: Tuple[float, ...] = CONFIDENCE_WEIGHTS) -> float:
+    """Weight the integer features and normalize the score to the 0-1 range"""
+    score = 0.0
+    for feature, weight in zip(features, weights):
+        score += feature * weight
+    return max(0.0, min(1.0, score))
+
+def feature_matrix(records: List[Dict]) -> np.ndarray:
+    """Stack the confidence features of formatted results into an (N, 5) array"""
+    return np.array([
+        confidence_features(
+            r["contract_indicators"], r["full_time_indicators"],
+            r["job_type_found"], r["hourly_rate"], r["duration"]
+        )
+        for r in records
+    ], dtype=np.float64).reshape(-1, len(CONFIDENCE_WEIGHTS))
+
+def rescore(features: np.ndarray, weights: Tuple[float, ...] = CONFIDENCE_WEIGHTS) -> np.ndarray:
+    """Score every row of a feature matrix at once, clamped to the 0-1 range"""
+    return np.clip(features @ np.asarray(weights, dtype=np.float64), 0.0, 1.0)
+
+def reweight_results(path: str, weights: Tuple[float, ...]) -> Dict:
+    """Re-score a saved verification output with new weights, without crawling"""
+    with open(path, 'rb') as f:
+        records = orjson.loads(f.read())["results"]
+    
+    scores = rescore(feature_matrix(records), weights)
+    for record, score in zip(records, scores.tolist()):
+        record["confidence_score"] = round(score, 3)
+        record["is_contract_job"] = record["is_accessible"] and score > 0.5
+    
+    return {
+        "results": records,
+        "verification_summary": {
+            "total_urls": len(records),
+            "accessible": sum(1 for r in records if r["is_accessible"]),
+            "contract_jobs": sum(1 for r in records if r["is_contract_job"]),
+            "non_contract_jobs": sum(1 for r in records if r["is_accessible"] and not r["is_contract_job"]),
+            "errors": sum(1 for r in records if not r["is_accessible"]),
+            "weights": list(weights),
+            "verified_at": datetime.now().isoformat()
+        }
+    }
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links to one page compare equal"""
+    parts = urlsplit(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
 def format_verification_result(result: JobVerificationResult) -> Dict:
     """Format verification result for JSON output"""
     return {
@@ -272,8 +474,8 @@ def format_verification_result(result: JobVerificationResult) -> Dict:
         "is_contract_job": result.is_contract_job,
         "confidence_score": round(result.confidence_score, 3),
         "job_type_found": result.job_type_found,
-        "contract_indicators": result.contract_indicators,
-        "full_time_indicators": result.full_time_indicators,
+        "contract_indicators": list(result.contract_indicators),
+        "full_time_indicators": list(result.full_time_indicators),
         "hourly_rate": result.hourly_rate,
         "duration": result.duration,
         "error_message": result.error_message,
@@ -285,8 +487,27 @@ async def main():
     if len(sys.argv) < 2:
         print("Usage: python crawl4ai-job-verifier.py <job_url> [job_url2] [job_url3] ...")
         print("   or: python crawl4ai-job-verifier.py --json-file urls.json")
+        print("   or: python crawl4ai-job-verifier.py --reweight w1,w2,w3,w4,w5 results.json")
         sys.exit(1)
     
+    if sys.argv[1] == '--reweight':
+        # Re-score a previous run's output; no pages are fetched
+        if len(sys.argv) < 4:
+            print("Error: weights and results JSON file required")
+            sys.exit(1)
+        
+        try:
+            weights = tuple(float(w) for w in sys.argv[2].split(','))
+            if len(weights) != len(CONFIDENCE_WEIGHTS):
+                raise ValueError(f"expected {len(CONFIDENCE_WEIGHTS)} weights, got {len(weights)}")
+            output = reweight_results(sys.argv[3], weights)
+        except Exception as e:
+            print(f"Error reweighting results: {e}")
+            sys.exit(1)
+        
+        sys.stdout.write(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode() + "\n")
+        return
+    
     verifier = Crawl4AIJobVerifier()
     
     if sys.argv[1] == '--json-file':
@@ -310,32 +531,61 @@ async def main():
         print("Error: No URLs provided")
         sys.exit(1)
     
-    print(f"🔍 Verifying {len(urls)} job posting(s)...")
+    # Group URLs by canonical form, but fetch each group's first URL exactly as
+    # given (canonicalizing can change paths and query escapes a site relies on),
+    # then report the result for every URL in the group
+    originals_by_canonical = {}
+    for url in urls:
+        originals_by_canonical.setdefault(canonicalize_url(url), []).append(url)
+    originals_by_fetched = {group[0]: group for group in originals_by_canonical.values()}
+    unique_urls = list(originals_by_fetched)
     
-    results = await verifier.verify_multiple_jobs(urls)
+    # Progress goes to stderr so stdout is pure JSON that --reweight can read back
+    print(f"🔍 Verifying {len(urls)} job posting(s) ({len(unique_urls)} unique)...", file=sys.stderr)
     
-    # Output results
-    output = {
-        "verification_summary": {
-            "total_urls": len(urls),
-            "accessible": sum(1 for r in results if r.is_accessible),
-            "contract_jobs": sum(1 for r in results if r.is_contract_job),
-            "non_contract_jobs": sum(1 for r in results if r.is_accessible and not r.is_contract_job),
-            "errors": sum(1 for r in results if not r.is_accessible),
-            "verified_at": datetime.now().isoformat()
-        },
-        "results": [format_verification_result(r) for r in results]
+    # Stream each result to stdout as it finishes; the summary follows the results
+    out_queue = asyncio.Queue(maxsize=CRAWL_CONCURRENCY * 2)
+    producer = asyncio.create_task(verifier.verify_stream(unique_urls, out_queue))
+    
+    summary = {
+        "total_urls": len(urls),
+        "accessible": 0,
+        "contract_jobs": 0,
+        "non_contract_jobs": 0,
+        "errors": 0
     }
     
-    print(json.dumps(output, indent=2))
+    separator = "\n  "
+    sys.stdout.write('{\n"results": [')
+    while (result := await out_queue.get()) is not None:
+        for original_url in originals_by_fetched[result.url]:
+            if result.is_accessible:
+                summary["accessible"] += 1
+                if result.is_contract_job:
+                    summary["contract_jobs"] += 1
+                else:
+                    summary["non_contract_jobs"] += 1
+            else:
+                summary["errors"] += 1
+            
+            record = format_verification_result(replace(result, url=original_url))
+            sys.stdout.write(separator + orjson.dumps(record).decode())
+            separator = ",\n  "
+    await producer
+    
+    summary["verified_at"] = datetime.now().isoformat()
+    sys.stdout.write('\n],\n"verification_summary": ' + orjson.dumps(summary).decode() + '\n}\n')
     
     # Summary
     print(f"\n📊 VERIFICATION SUMMARY:", file=sys.stderr)
-    print(f"   Total URLs: {output['verification_summary']['total_urls']}", file=sys.stderr)
-    print(f"   Accessible: {output['verification_summary']['accessible']}", file=sys.stderr)
-    print(f"   Contract Jobs: {output['verification_summary']['contract_jobs']}", file=sys.stderr)
-    print(f"   Non-Contract: {output['verification_summary']['non_contract_jobs']}", file=sys.stderr)
-    print(f"   Errors: {output['verification_summary']['errors']}", file=sys.stderr)
+    print(f"   Total URLs: {summary['total_urls']}", file=sys.stderr)
+    print(f"   Accessible: {summary['accessible']}", file=sys.stderr)
+    print(f"   Contract Jobs: {summary['contract_jobs']}", file=sys.stderr)
+    print(f"   Non-Contract: {summary['non_contract_jobs']}", file=sys.stderr)
+    print(f"   Errors: {summary['errors']}", file=sys.stderr)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
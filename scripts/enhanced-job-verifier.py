@@ -7,13 +7,18 @@ to create a comprehensive job validation system for ContractsOnly.
 """
 
 import asyncio
-import json
 import sys
 import os
 import re
+import shelve
+import time
+from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlparse
+
+import orjson
 
 # Import the enhanced scoring algorithm from jobspy-scraper
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -24,7 +29,96 @@ except ImportError:
     print("❌ Error: crawl4ai not installed. Install with: pip install crawl4ai")
     sys.exit(1)
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-keyword substring scans
+
+try:
+    import requests
+    from bs4 import BeautifulSoup
+except ImportError:
+    requests = None  # Every page goes through Crawl4AI
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Use the default asyncio event loop
+
+# Static pages are fetched with a plain GET and only sent to the browser when
+# the HTML or its text is too small, or the text shows nothing specific to the
+# posting (no title, job type or hourly rate), as on JS-rendered shells
+STATIC_FETCH_MIN_CHARS = 4096
+STATIC_TEXT_MIN_CHARS = 1000
+STATIC_FETCH_TIMEOUT = 10
+STATIC_FETCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml',
+}
+
+# Fetch throttling: at most PER_HOST_CONCURRENCY pages per host at a time,
+# and at most MAX_CONCURRENT_HOSTS hosts being fetched at once
+PER_HOST_CONCURRENCY = 2
+MAX_CONCURRENT_HOSTS = 10
+
+# Page analyses are cached on disk by URL so reruns skip Crawl4AI for recent postings
+VERIFIER_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.verifier_cache')
+VERIFIER_CACHE_TTL_SECONDS = int(os.getenv("VERIFIER_CACHE_TTL", str(7 * 24 * 3600)))
+
+# Scoring patterns, matched against already-lowercased text
+_HOURLY_RE = re.compile(r'\$\d+.*(?:/hr|/hour|per hour|hourly)')
+_HOURLY_RATE_RE = re.compile(r'hourly.*rate|rate.*hourly')
+_DUR_CONTRACT_RE = re.compile(r'\d+\s*(?:month|week|months|weeks)\s*(?:contract|project|assignment)')
+_DUR_ANY_RE = re.compile(r'\d+\s*(?:month|week|months|weeks)')
+_JOBTYPE_FT_RE = re.compile(r'job\s*type\s*:?\s*full[-\s]*time|employment\s*type\s*:?\s*full[-\s]*time')
+_JOBTYPE_PERM_RE = re.compile(r'job\s*type\s*:?\s*permanent|employment\s*type\s*:?\s*permanent')
+_JOBTYPE_CONTRACT_RE = re.compile(r'job\s*type\s*:?\s*contract|employment\s*type\s*:?\s*contract')
+_JOBTYPE_TEMP_RE = re.compile(r'job\s*type\s*:?\s*(?:temp|temporary|freelance)')
+
+# Extraction patterns, tried in order; the first pattern that matches wins.
+# Extractors are given lowercased text, and every pattern in a family contains
+# one of the family's trigger substrings, so a family whose triggers are absent
+# is skipped without any regex scan.
+_JOB_TYPE_TRIGGERS = ('type',)
+_HOURLY_RATE_TRIGGERS = ('hr', 'hour')
+_DURATION_TRIGGERS = ('month', 'week', 'term', 'duration')
+
+_JOB_TYPE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'job\s*type\s*:?\s*([^,.\n]+)',
+    r'employment\s*type\s*:?\s*([^,.\n]+)',
+    r'position\s*type\s*:?\s*([^,.\n]+)',
+    r'work\s*type\s*:?\s*([^,.\n]+)'
+]]
+
+_HOURLY_RATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)',
+    r'\$(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)',
+    r'(\d+(?:\.\d{2})?)\s*-\s*(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)',
+    r'(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour|hourly)'
+]]
+
+_DURATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'(\d+)\s*(month|months)',
+    r'(\d+)\s*(week|weeks)',
+    r'(\d+)\s*-\s*(\d+)\s*(month|months)',
+    r'(short\s*term|long\s*term)',
+    r'duration\s*:?\s*([^,.\n]+)'
+]]
+
+# Scraped job_type values that are rejected without fetching the page
+_REJECT_JOB_TYPES = frozenset({'fulltime', 'full-time', 'full_time', 'permanent', 'employee', 'staff'})
+
+# Initial scores clear enough to decide without Crawl4AI: a high score backed by
+# several contract indicators, or a near-zero score with several exclusions
+DECISIVE_ACCEPT_SCORE = 0.85
+DECISIVE_REJECT_SCORE = 0.05
+DECISIVE_MIN_INDICATORS = 3
+DECISIVE_MIN_EXCLUSIONS = 2
+
+# Largest hourly + duration + job type bonus calculate_initial_score can award
+_MAX_REGEX_BONUS = 0.3 + 0.2 + 0.4
+
+@dataclass(slots=True, frozen=True)
 class EnhancedVerificationResult:
     url: str
     is_accessible: bool
@@ -40,10 +134,13 @@ class EnhancedVerificationResult:
     hourly_rate: Optional[str]
     duration: Optional[str]
     error_message: Optional[str]
-    verification_method: str  # 'SCRAPING_ONLY', 'CRAWL4AI_VERIFIED', 'BOTH'
+    verification_method: str  # 'SCRAPING_ONLY', 'CRAWL4AI_VERIFIED', 'STATIC_VERIFIED', 'BOTH'
 
 class EnhancedJobVerifier:
-    def __init__(self):
+    def __init__(self, use_cache: bool = False):
+        # Let Crawl4AI serve pages from its own cache instead of refetching them
+        self.use_cache = use_cache
+        
         # Enhanced contract keywords with weights
         self.contract_keywords = {
             # High confidence contract indicators
@@ -103,62 +200,109 @@ class EnhancedJobVerifier:
             'staff position': 2,
             'direct hire': 2
         }
+        
+        # Every scored keyword, matched together in one pass over the text
+        self.all_keywords = tuple(dict.fromkeys(
+            list(self.contract_keywords) + list(self.strong_exclude_keywords)
+            + list(self.medium_exclude_keywords)
+        ))
+        self._automaton = self._build_automaton()
+        
+        # HTTP session for static page fetches, shared by the fetch threads
+        self._http = None
+        if requests is not None:
+            self._http = requests.Session()
+            self._http.headers.update(STATIC_FETCH_HEADERS)
+        
+        # Strong then medium exclusions, scored in one loop: (keyword, weight, is_strong)
+        self._exclude_keywords = tuple(
+            [(keyword, weight, True) for keyword, weight in self.strong_exclude_keywords.items()]
+            + [(keyword, weight, False) for keyword, weight in self.medium_exclude_keywords.items()]
+        )
+
+    def _build_automaton(self):
+        """Build an Aho-Corasick automaton over every scored keyword"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in self.all_keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    def _find_keywords(self, text: str) -> set:
+        """Return the set of scored keywords that occur in the text"""
+        if self._automaton is None:
+            # Plain substring checks, not one alternation regex: re tries every alternative
+            # at each position, which measured ~3x slower here, and finditer would also
+            # drop keywords that overlap a longer match ('contract' in 'contractor')
+            return {keyword for keyword in self.all_keywords if keyword in text}
+        return {keyword for _, keyword in self._automaton.iter(text)}
 
     def calculate_initial_score(self, description: str, title: str = "") -> Tuple[float, List[str], List[str]]:
         """Calculate initial contract score from scraped data"""
         if not description:
             return 0.0, [], []
         
-        text = (description + " " + title).lower()
+        text = description.lower()
+        if title:
+            text += " " + title.lower()
+        return self._score_text(text)
+
+    def _score_text(self, text: str) -> Tuple[float, List[str], List[str]]:
+        """Score already-lowercased text"""
+        found = self._find_keywords(text)
         
         # Find contract indicators
         contract_indicators = []
         positive_score = 0
         for keyword, weight in self.contract_keywords.items():
-            if keyword in text:
+            if keyword in found:
                 contract_indicators.append(keyword)
                 positive_score += weight * 0.1
         
-        # Find exclusion indicators
-        full_time_indicators = []
+        # Find exclusion indicators (dict keys act as an ordered set, avoiding duplicates)
+        full_time_indicators = {}
         strong_negative_score = 0
-        for keyword, weight in self.strong_exclude_keywords.items():
-            if keyword in text:
-                full_time_indicators.append(keyword)
-                strong_negative_score += weight * 0.15
-        
         medium_negative_score = 0
-        for keyword, weight in self.medium_exclude_keywords.items():
-            if keyword in text:
-                if keyword not in full_time_indicators:  # Avoid duplicates
-                    full_time_indicators.append(keyword)
-                medium_negative_score += weight * 0.05
+        for keyword, weight, is_strong in self._exclude_keywords:
+            if keyword in found:
+                full_time_indicators[keyword] = None
+                if is_strong:
+                    strong_negative_score += weight * 0.15
+                else:
+                    medium_negative_score += weight * 0.05
+        
+        # Exclusions that outweigh every possible bonus always clamp to 0, so skip the regex scans
+        if positive_score + _MAX_REGEX_BONUS < strong_negative_score + medium_negative_score:
+            return 0.0, contract_indicators, list(full_time_indicators)
         
         # Bonus for hourly rate mentions
         hourly_bonus = 0
-        if re.search(r'\$\d+.*(?:/hr|/hour|per hour|hourly)', text):
+        if _HOURLY_RE.search(text):
             hourly_bonus = 0.3
-        elif re.search(r'hourly.*rate|rate.*hourly', text):
+        elif _HOURLY_RATE_RE.search(text):
             hourly_bonus = 0.2
         
         # Bonus for duration mentions
         duration_bonus = 0
-        if re.search(r'\d+\s*(?:month|week|months|weeks)\s*(?:contract|project|assignment)', text):
+        if _DUR_CONTRACT_RE.search(text):
             duration_bonus = 0.2
-        elif re.search(r'\d+\s*(?:month|week|months|weeks)', text):
+        elif _DUR_ANY_RE.search(text):
             duration_bonus = 0.1
         
         # Check for explicit job type mentions
         job_type_penalty = 0
-        if re.search(r'job\s*type\s*:?\s*full[-\s]*time', text) or re.search(r'employment\s*type\s*:?\s*full[-\s]*time', text):
+        if _JOBTYPE_FT_RE.search(text):
             job_type_penalty = 0.5
-        elif re.search(r'job\s*type\s*:?\s*permanent', text) or re.search(r'employment\s*type\s*:?\s*permanent', text):
+        elif _JOBTYPE_PERM_RE.search(text):
             job_type_penalty = 0.4
         
         job_type_bonus = 0
-        if re.search(r'job\s*type\s*:?\s*contract', text) or re.search(r'employment\s*type\s*:?\s*contract', text):
+        if _JOBTYPE_CONTRACT_RE.search(text):
             job_type_bonus = 0.4
-        elif re.search(r'job\s*type\s*:?\s*(?:temp|temporary|freelance)', text):
+        elif _JOBTYPE_TEMP_RE.search(text):
             job_type_bonus = 0.3
         
         # Calculate final score
@@ -172,83 +316,96 @@ class EnhancedJobVerifier:
             final_score = min(final_score, 0.1)  # Cap at very low score
         
         # Normalize to 0-1 range
-        return max(0.0, min(1.0, final_score)), contract_indicators, full_time_indicators
+        return max(0.0, min(1.0, final_score)), contract_indicators, list(full_time_indicators)
 
-    async def verify_with_crawl4ai(self, url: str) -> Tuple[float, Optional[str], List[str], List[str], Optional[str], Optional[str]]:
-        """Verify job using Crawl4AI to fetch original content"""
+    def _fetch_static_text(self, url: str, title: str = "") -> Optional[str]:
+        """GET a page without the browser and return its text, or None if it needs Crawl4AI"""
+        if self._http is None:
+            return None
+        
         try:
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    word_count_threshold=10,
-                    extraction_strategy="NoExtractionStrategy",
-                    bypass_cache=True
-                )
-                
-                if not result.success:
-                    return 0.0, None, [], [], None, f"Failed to fetch: {result.status_code}"
-                
-                # Use markdown content if available, otherwise cleaned HTML
-                content = result.markdown or result.cleaned_html or result.html or ""
-                
-                if not content:
-                    return 0.0, None, [], [], None, "No content extracted"
-                
-                # Analyze the fetched content
-                score, contract_indicators, full_time_indicators = self.calculate_initial_score(content)
-                
-                # Extract additional information
-                job_type = self._extract_job_type(content.lower())
-                hourly_rate = self._extract_hourly_rate(content.lower())
-                duration = self._extract_duration(content.lower())
-                
-                return score, job_type, contract_indicators, full_time_indicators, hourly_rate, duration
-                
-        except Exception as e:
-            return 0.0, None, [], [], None, str(e)
+            response = self._http.get(url, timeout=STATIC_FETCH_TIMEOUT)
+        except requests.RequestException:
+            return None
+        
+        if not response.ok or 'html' not in response.headers.get('Content-Type', ''):
+            return None
+        if len(response.text) < STATIC_FETCH_MIN_CHARS:
+            return None
+        
+        text = BeautifulSoup(response.text, 'html.parser').get_text(' ', strip=True)
+        if len(text) < STATIC_TEXT_MIN_CHARS:
+            return None
+        
+        # Generic keywords like 'temp' or 'salary' turn up on almost any page, so
+        # require something specific to this posting before skipping the browser
+        lowered = text.lower()
+        title = (title or '').lower().strip()
+        if not ((title and title in lowered) or self._extract_job_type(lowered)
+                or self._extract_hourly_rate(lowered)):
+            return None
+        return text
+
+    def analyze_crawl_result(self, result) -> Tuple[float, Optional[str], List[str], List[str], Optional[str], Optional[str]]:
+        """Score a Crawl4AI result or static page text, reporting failed or empty fetches in the duration slot"""
+        if isinstance(result, str):
+            return self.analyze_content(result)
+        
+        if not result.success:
+            return 0.0, None, [], [], None, f"Failed to fetch: {result.status_code}"
+        
+        # Use markdown content if available, otherwise cleaned HTML
+        content = result.markdown or result.cleaned_html or result.html or ""
+        
+        if not content:
+            return 0.0, None, [], [], None, "No content extracted"
+        
+        return self.analyze_content(content)
+
+    def analyze_content(self, content: str) -> Tuple[float, Optional[str], List[str], List[str], Optional[str], Optional[str]]:
+        """Score fetched content and extract job type, hourly rate and duration"""
+        # Lowercase once for both the scoring and the extractors
+        text = content.lower()
+        score, contract_indicators, full_time_indicators = self._score_text(text)
+        
+        job_type = self._extract_job_type(text)
+        hourly_rate = self._extract_hourly_rate(text)
+        duration = self._extract_duration(text)
+        
+        return score, job_type, contract_indicators, full_time_indicators, hourly_rate, duration
+
+    def close(self):
+        """Close the static fetch session"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def _extract_job_type(self, text: str) -> Optional[str]:
         """Extract explicitly mentioned job type"""
-        job_type_patterns = [
-            r'job\s*type\s*:?\s*([^,.\n]+)',
-            r'employment\s*type\s*:?\s*([^,.\n]+)',
-            r'position\s*type\s*:?\s*([^,.\n]+)',
-            r'work\s*type\s*:?\s*([^,.\n]+)'
-        ]
-        
-        for pattern in job_type_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if not any(trigger in text for trigger in _JOB_TYPE_TRIGGERS):
+            return None
+        for pattern in _JOB_TYPE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
 
     def _extract_hourly_rate(self, text: str) -> Optional[str]:
         """Extract hourly rate information"""
-        hourly_rate_patterns = [
-            r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)',
-            r'\$(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)',
-            r'(\d+(?:\.\d{2})?)\s*-\s*(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)',
-            r'(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour|hourly)'
-        ]
-        
-        for pattern in hourly_rate_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if not any(trigger in text for trigger in _HOURLY_RATE_TRIGGERS):
+            return None
+        for pattern in _HOURLY_RATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         return None
 
     def _extract_duration(self, text: str) -> Optional[str]:
         """Extract contract duration information"""
-        duration_patterns = [
-            r'(\d+)\s*(month|months)',
-            r'(\d+)\s*(week|weeks)',
-            r'(\d+)\s*-\s*(\d+)\s*(month|months)',
-            r'(short\s*term|long\s*term)',
-            r'duration\s*:?\s*([^,.\n]+)'
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if not any(trigger in text for trigger in _DURATION_TRIGGERS):
+            return None
+        for pattern in _DURATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         return None
@@ -298,15 +455,11 @@ class EnhancedJobVerifier:
         
         return final_score, confidence, recommendation, verification_method
 
-    async def verify_job(self, job_data: Dict) -> EnhancedVerificationResult:
-        """Perform comprehensive job verification"""
+    def _explicit_job_type_reject(self, job_data: Dict) -> Optional[EnhancedVerificationResult]:
+        """Return an immediate rejection when the scraped job type is explicitly non-contract"""
         url = job_data.get('job_url', '')
-        title = job_data.get('title', '')
-        description = job_data.get('description', '')
-        
-        # Step 1: Check explicit job type first (avoid wasted Crawl4AI calls)
-        job_type_field = job_data.get('job_type', '').lower().strip()
-        if job_type_field in ['fulltime', 'full-time', 'full_time', 'permanent', 'employee', 'staff']:
+        job_type_field = (job_data.get('job_type') or '').lower().strip()
+        if job_type_field in _REJECT_JOB_TYPES:
             # Immediate rejection for explicit non-contract types
             return EnhancedVerificationResult(
                 url=url,
@@ -326,11 +479,47 @@ class EnhancedJobVerifier:
                 verification_method="EXPLICIT_JOB_TYPE_REJECT"
             )
         
-        # Step 2: Calculate initial score from scraped data
-        initial_score, initial_contract_indicators, initial_full_time_indicators = self.calculate_initial_score(description, title)
+        return None
+
+    def _decisive_initial_result(self, job_data: Dict, initial: Tuple) -> Optional[EnhancedVerificationResult]:
+        """Return a final result when the scraped-data score alone is clear enough to skip Crawl4AI"""
+        initial_score, initial_contract_indicators, initial_full_time_indicators = initial
+        
+        if initial_score >= DECISIVE_ACCEPT_SCORE and len(initial_contract_indicators) >= DECISIVE_MIN_INDICATORS:
+            recommendation = "ACCEPT"
+        elif initial_score <= DECISIVE_REJECT_SCORE and len(initial_full_time_indicators) >= DECISIVE_MIN_EXCLUSIONS:
+            recommendation = "REJECT"
+        else:
+            return None
+        
+        return EnhancedVerificationResult(
+            url=job_data.get('job_url', ''),
+            is_accessible=False,
+            initial_score=initial_score,
+            crawl4ai_score=0.0,
+            final_score=initial_score,
+            is_contract_job=recommendation == "ACCEPT",
+            confidence_level="HIGH",
+            recommendation=recommendation,
+            job_type_found=None,
+            contract_indicators=initial_contract_indicators,
+            full_time_indicators=initial_full_time_indicators,
+            hourly_rate=None,
+            duration=None,
+            error_message=None,
+            verification_method="SCRAPING_ONLY_HIGH_CONFIDENCE"
+        )
+
+    def _combine_results(self, job_data: Dict, initial: Tuple, crawl4ai_analysis: Tuple,
+                         static_page: bool = False) -> EnhancedVerificationResult:
+        """Combine the scraped-data score with a page analysis into a final decision"""
+        url = job_data.get('job_url', '')
+        
+        # Step 2: Initial score from scraped data
+        initial_score, initial_contract_indicators, initial_full_time_indicators = initial
         
-        # Step 3: Verify with Crawl4AI
-        crawl4ai_score, job_type, crawl4ai_contract_indicators, crawl4ai_full_time_indicators, hourly_rate, duration = await self.verify_with_crawl4ai(url)
+        # Step 3: Unpack the Crawl4AI verification
+        crawl4ai_score, job_type, crawl4ai_contract_indicators, crawl4ai_full_time_indicators, hourly_rate, duration = crawl4ai_analysis
         
         # Combine indicators from both sources
         all_contract_indicators = list(set(initial_contract_indicators + crawl4ai_contract_indicators))
@@ -341,6 +530,8 @@ class EnhancedJobVerifier:
         final_score, confidence, recommendation, verification_method = self.determine_final_decision(
             initial_score, crawl4ai_score, has_crawl4ai_data
         )
+        if static_page and verification_method == "CRAWL4AI_VERIFIED":
+            verification_method = "STATIC_VERIFIED"
         
         is_contract_job = recommendation == "ACCEPT"
         
@@ -363,49 +554,203 @@ class EnhancedJobVerifier:
         )
 
     async def verify_multiple_jobs(self, jobs_data: List[Dict]) -> List[EnhancedVerificationResult]:
-        """Verify multiple jobs with rate limiting"""
-        results = []
+        """Verify multiple jobs, fetching every page in one Crawl4AI batch"""
+        results: List[Optional[EnhancedVerificationResult]] = [None] * len(jobs_data)
         
-        # Process in batches to avoid overwhelming the target sites
-        batch_size = 5
-        for i in range(0, len(jobs_data), batch_size):
-            batch = jobs_data[i:i + batch_size]
-            
-            # Process batch concurrently
-            tasks = [self.verify_job(job) for job in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    # Create error result
-                    error_result = EnhancedVerificationResult(
-                        url=batch[j].get('job_url', ''),
-                        is_accessible=False,
-                        initial_score=0.0,
-                        crawl4ai_score=0.0,
-                        final_score=0.0,
-                        is_contract_job=False,
-                        confidence_level="LOW",
-                        recommendation="REJECT",
-                        job_type_found=None,
-                        contract_indicators=[],
-                        full_time_indicators=[],
-                        hourly_rate=None,
-                        duration=None,
-                        error_message=str(result),
-                        verification_method="ERROR"
-                    )
-                    results.append(error_result)
-                else:
-                    results.append(result)
+        # Phase 1: Settle explicit job type rejections and decisive initial scores
+        # without touching the network
+        pending = []
+        initials: Dict[Tuple[str, str], Tuple[float, List[str], List[str]]] = {}
+        for i, job in enumerate(jobs_data):
+            text_key = (job.get('title', ''), job.get('description', ''))
+            try:
+                rejected = self._explicit_job_type_reject(job)
+                if rejected is not None:
+                    results[i] = rejected
+                    continue
+                
+                if text_key not in initials:
+                    initials[text_key] = self.calculate_initial_score(text_key[1], text_key[0])
+                decided = self._decisive_initial_result(job, initials[text_key])
+            except Exception as e:
+                results[i] = self._error_result(job.get('job_url', ''), e)
+                continue
+            if decided is not None:
+                results[i] = decided
+            else:
+                pending.append(i)
+        
+        if pending:
+            cache = self._open_cache()
+            try:
+                # Phase 2: Reuse recent analyses and fetch each remaining URL only once
+                analyses = {}
+                static_urls = set()  # Pages analyzed from a plain GET rather than Crawl4AI
+                titles: Dict[str, str] = {}
+                now = time.time()
+                by_host: Dict[str, List[str]] = defaultdict(list)
+                for i in pending:
+                    url = jobs_data[i].get('job_url', '')
+                    if url in analyses:
+                        continue
+                    titles[url] = jobs_data[i].get('title') or ''
+                    hit = cache.get(url)
+                    if hit and now - hit['ts'] < VERIFIER_CACHE_TTL_SECONDS:
+                        analyses[url] = hit['analysis']
+                        if hit.get('static'):
+                            static_urls.add(url)
+                    else:
+                        analyses[url] = None
+                        by_host[urlparse(url).netloc].append(url)
+                
+                if by_host:
+                    # Fetch hosts in parallel but each host throttled, instead of
+                    # pausing between fixed-size batches; static pages skip the browser
+                    crawl_results = {}
+                    host_limit = asyncio.Semaphore(MAX_CONCURRENT_HOSTS)
+                    await asyncio.gather(*(
+                        self._fetch_host_static(urls, titles, host_limit, crawl_results)
+                        for urls in by_host.values()
+                    ))
+                    
+                    browser_hosts = [
+                        [url for url in urls if url not in crawl_results] for urls in by_host.values()
+                    ]
+                    browser_hosts = [urls for urls in browser_hosts if urls]
+                    if browser_hosts:
+                        try:
+                            async with AsyncWebCrawler(verbose=False) as crawler:
+                                await asyncio.gather(*(
+                                    self._fetch_host(crawler, urls, host_limit, crawl_results)
+                                    for urls in browser_hosts
+                                ))
+                        except Exception as e:
+                            # Browser failed to start (or shut down): every page it
+                            # did not return falls back to the scraped data
+                            for urls in browser_hosts:
+                                for url in urls:
+                                    crawl_results.setdefault(url, e)
+                    
+                    # Score the fetched pages, caching those that returned content; every
+                    # fetch has finished by now, so the millisecond-scale regex work runs inline
+                    for url, crawl_result in crawl_results.items():
+                        analysis = self._analyze_or_error(crawl_result)
+                        analyses[url] = analysis
+                        static = isinstance(crawl_result, str)
+                        if static:
+                            static_urls.add(url)
+                        if self._has_content(crawl_result):
+                            cache[url] = {'analysis': analysis, 'ts': now, 'static': static}
+            finally:
+                if isinstance(cache, shelve.Shelf):
+                    cache.close()
             
-            # Add delay between batches
-            if i + batch_size < len(jobs_data):
-                await asyncio.sleep(2)  # 2 second delay between batches
+            # Phase 3: Combine each job's scraped data with its page analysis; cross-posted
+            # duplicates (same URL, title and description) share one immutable result
+            combined: Dict[Tuple[str, str, str], EnhancedVerificationResult] = {}
+            for i in pending:
+                job = jobs_data[i]
+                url = job.get('job_url', '')
+                text_key = (job.get('title', ''), job.get('description', ''))
+                key = (url,) + text_key
+                result = combined.get(key)
+                if result is None:
+                    try:
+                        result = self._combine_results(
+                            job, initials[text_key], analyses[url], url in static_urls
+                        )
+                    except Exception as e:
+                        result = self._error_result(url, e)
+                    combined[key] = result
+                results[i] = result
         
         return results
 
-def format_verification_result(result: EnhancedVerificationResult) -> Dict:
+    @staticmethod
+    def _open_cache():
+        """Open the page analysis cache, or an empty dict when it cannot be opened"""
+        try:
+            return shelve.open(VERIFIER_CACHE_PATH)
+        except Exception as e:
+            print(f"⚠️  Verifier cache unavailable, continuing without it: {e}", file=sys.stderr)
+            return {}
+
+    async def _fetch_host_static(self, urls: List[str], titles: Dict[str, str],
+                                 host_limit: asyncio.Semaphore, crawl_results: Dict):
+        """Fetch one host's static pages in chunks of PER_HOST_CONCURRENCY, recording their text"""
+        if self._http is None:
+            return
+        async with host_limit:
+            for start in range(0, len(urls), PER_HOST_CONCURRENCY):
+                chunk = urls[start:start + PER_HOST_CONCURRENCY]
+                texts = await asyncio.gather(*(asyncio.to_thread(self._fetch_static_text, url, titles.get(url, '')) for url in chunk))
+                crawl_results.update((url, text) for url, text in zip(chunk, texts) if text is not None)
+
+    async def _fetch_host(self, crawler: AsyncWebCrawler, urls: List[str],
+                          host_limit: asyncio.Semaphore, crawl_results: Dict):
+        """Fetch one host's pages in arun_many chunks of PER_HOST_CONCURRENCY"""
+        async with host_limit:
+            for start in range(0, len(urls), PER_HOST_CONCURRENCY):
+                chunk = urls[start:start + PER_HOST_CONCURRENCY]
+                try:
+                    fetched = await crawler.arun_many(
+                        urls=chunk,
+                        word_count_threshold=10,
+                        extraction_strategy="NoExtractionStrategy",
+                        bypass_cache=not self.use_cache
+                    )
+                except Exception as e:
+                    crawl_results.update((url, e) for url in chunk)
+                    continue
+                
+                # Results arrive in completion order, so match them back to the requested URLs
+                by_url = {}
+                for result in fetched:
+                    by_url.setdefault(result.url, result)
+                    if getattr(result, 'redirected_url', None):
+                        by_url.setdefault(result.redirected_url, result)
+                for url in chunk:
+                    crawl_results[url] = by_url.get(url) or RuntimeError("No crawl result returned")
+
+    @staticmethod
+    def _has_content(crawl_result) -> bool:
+        """Whether a batch result is a successful fetch with page content"""
+        if isinstance(crawl_result, str):
+            return True
+        return (not isinstance(crawl_result, Exception) and crawl_result.success
+                and bool(crawl_result.markdown or crawl_result.cleaned_html or crawl_result.html))
+
+    def _analyze_or_error(self, crawl_result) -> Tuple[float, Optional[str], List[str], List[str], Optional[str], Optional[str]]:
+        """Analyze one batch result, turning a failed fetch into the usual error tuple"""
+        try:
+            if isinstance(crawl_result, Exception):
+                raise crawl_result
+            return self.analyze_crawl_result(crawl_result)
+        except Exception as e:
+            return 0.0, None, [], [], None, str(e)
+
+    @staticmethod
+    def _error_result(url: str, error: Exception) -> EnhancedVerificationResult:
+        """Build the rejection recorded when verifying a job raises"""
+        return EnhancedVerificationResult(
+            url=url,
+            is_accessible=False,
+            initial_score=0.0,
+            crawl4ai_score=0.0,
+            final_score=0.0,
+            is_contract_job=False,
+            confidence_level="LOW",
+            recommendation="REJECT",
+            job_type_found=None,
+            contract_indicators=[],
+            full_time_indicators=[],
+            hourly_rate=None,
+            duration=None,
+            error_message=str(error),
+            verification_method="ERROR"
+        )
+
+def format_verification_result(result: EnhancedVerificationResult, verified_at: str) -> Dict:
     """Format verification result for JSON output"""
     return {
         "url": result.url,
@@ -423,20 +768,37 @@ def format_verification_result(result: EnhancedVerificationResult) -> Dict:
         "duration": result.duration,
         "error_message": result.error_message,
         "verification_method": result.verification_method,
-        "verified_at": datetime.now().isoformat()
+        "verified_at": verified_at
     }
 
 async def main():
     """Main function for CLI usage"""
-    if len(sys.argv) < 2:
-        print("Usage: python enhanced-job-verifier.py <scraped_jobs.json>")
+    args = sys.argv[1:]
+    
+    # Optional: reuse Crawl4AI's page cache from earlier runs
+    use_cache = '--use-cache' in args
+    if use_cache:
+        args.remove('--use-cache')
+    
+    # Optional: write the JSON results to a file instead of stdout
+    output_file = None
+    if '--json-output-file' in args:
+        flag_index = args.index('--json-output-file')
+        if flag_index + 1 >= len(args):
+            print("Error: --json-output-file requires a path")
+            sys.exit(1)
+        output_file = args[flag_index + 1]
+        del args[flag_index:flag_index + 2]
+    
+    if not args:
+        print("Usage: python enhanced-job-verifier.py <scraped_jobs.json> [--json-output-file results.json] [--use-cache]")
         sys.exit(1)
     
-    jobs_file = sys.argv[1]
+    jobs_file = args[0]
     
     try:
-        with open(jobs_file, 'r') as f:
-            jobs_data = json.load(f)
+        with open(jobs_file, 'rb') as f:
+            jobs_data = orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading jobs file: {e}")
         sys.exit(1)
@@ -445,19 +807,26 @@ async def main():
         print("No jobs found in input file")
         sys.exit(1)
     
-    verifier = EnhancedJobVerifier()
+    verifier = EnhancedJobVerifier(use_cache=use_cache)
     
     print(f"🔍 Enhanced verification of {len(jobs_data)} job posting(s)...")
     
-    results = await verifier.verify_multiple_jobs(jobs_data)
+    try:
+        results = await verifier.verify_multiple_jobs(jobs_data)
+    finally:
+        verifier.close()
     
-    # Analyze results
-    accept_count = sum(1 for r in results if r.recommendation == "ACCEPT")
-    reject_count = sum(1 for r in results if r.recommendation == "REJECT")
-    manual_review_count = sum(1 for r in results if r.recommendation == "MANUAL_REVIEW")
+    # Analyze results in one pass
+    recommendation_counts = Counter(r.recommendation for r in results)
+    accept_count = recommendation_counts["ACCEPT"]
+    reject_count = recommendation_counts["REJECT"]
+    manual_review_count = recommendation_counts["MANUAL_REVIEW"]
     error_count = sum(1 for r in results if r.error_message)
+    crawl4ai_count = sum(1 for r in results if r.verification_method == "CRAWL4AI_VERIFIED")
+    static_count = sum(1 for r in results if r.verification_method == "STATIC_VERIFIED")
     
-    # Output results
+    # Output results, stamped with one timestamp for the whole batch
+    verified_at = datetime.now().isoformat()
     output = {
         "verification_summary": {
             "total_jobs": len(jobs_data),
@@ -465,13 +834,18 @@ async def main():
             "rejected": reject_count,
             "manual_review": manual_review_count,
             "errors": error_count,
-            "crawl4ai_verified": sum(1 for r in results if r.verification_method == "CRAWL4AI_VERIFIED"),
-            "verified_at": datetime.now().isoformat()
+            "crawl4ai_verified": crawl4ai_count,
+            "static_verified": static_count,
+            "verified_at": verified_at
         },
-        "results": [format_verification_result(r) for r in results]
+        "results": [format_verification_result(r, verified_at) for r in results]
     }
     
-    print(json.dumps(output, indent=2))
+    if output_file:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        sys.stdout.write(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode() + "\n")
     
     # Summary
     print(f"\n📊 ENHANCED VERIFICATION SUMMARY:", file=sys.stderr)
@@ -480,7 +854,11 @@ async def main():
     print(f"   ❌ Reject: {reject_count}", file=sys.stderr)
     print(f"   🔍 Manual Review: {manual_review_count}", file=sys.stderr)
     print(f"   ⚠️  Errors: {error_count}", file=sys.stderr)
-    print(f"   🌐 Crawl4AI Verified: {sum(1 for r in results if r.verification_method == 'CRAWL4AI_VERIFIED')}", file=sys.stderr)
+    print(f"   🌐 Crawl4AI Verified: {crawl4ai_count}", file=sys.stderr)
+    print(f"   📄 Static Page Verified: {static_count}", file=sys.stderr)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -3,57 +3,48 @@
 Extract jobs that need manual review from the latest verification run
 """
 
-import json
+import os
+import subprocess
 import sys
+import tempfile
+
+import orjson
 
 def extract_manual_reviews():
-    # Run the verification and capture just the JSON output
-    import subprocess
-    import os
-    
     # Change to the scripts directory
     os.chdir('/root/contracts-only/scripts')
     
-    # Activate the environment and run verification
-    cmd = ['bash', '-c', 'source ../job-scraper-env/bin/activate && python3 enhanced-job-verifier.py temp-scraped-jobs.json']
-    
+    # Run the verification and read its JSON results file
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-        output_lines = result.stdout.strip().split('\n')
-        
-        # Find the JSON part (starts with '{' and ends with '}')
-        json_start = -1
-        json_end = -1
-        brace_count = 0
-        
-        for i, line in enumerate(output_lines):
-            if line.strip().startswith('{') and json_start == -1:
-                json_start = i
-                brace_count = 1
-            elif json_start != -1:
-                brace_count += line.count('{') - line.count('}')
-                if brace_count == 0:
-                    json_end = i
-                    break
-        
-        if json_start != -1 and json_end != -1:
-            json_text = '\n'.join(output_lines[json_start:json_end+1])
-            verification_data = json.loads(json_text)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results_path = os.path.join(tmp_dir, 'verification-results.json')
             
-            # Find manual review jobs
-            manual_review_jobs = []
-            for result in verification_data.get('results', []):
-                if result.get('recommendation') == 'MANUAL_REVIEW':
-                    manual_review_jobs.append(result)
+            # Activate the environment and run verification
+            cmd = ['bash', '-c', 'source ../job-scraper-env/bin/activate && python3 enhanced-job-verifier.py temp-scraped-jobs.json --json-output-file "$0"', results_path]
+            # stderr is inherited so a verifier crash shows its traceback
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True, timeout=300)
             
-            return manual_review_jobs, verification_data.get('verification_summary', {})
-        else:
-            print("❌ Could not extract JSON from verification output")
-            return [], {}
+            if not os.path.exists(results_path):
+                print("❌ Verification did not produce a results file")
+                return [], {}
+            
+            with open(results_path, 'rb') as f:
+                verification_data = orjson.loads(f.read())
+        
+        # Find manual review jobs
+        manual_review_jobs = []
+        for result in verification_data.get('results', []):
+            if result.get('recommendation') == 'MANUAL_REVIEW':
+                manual_review_jobs.append(result)
+        
+        return manual_review_jobs, verification_data.get('verification_summary', {})
             
     except subprocess.TimeoutExpired:
         print("❌ Verification timeout - taking too long")
         return [], {}
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Verification failed with exit status {e.returncode} (see error output above)")
+        return [], {}
     except Exception as e:
         print(f"❌ Error running verification: {e}")
         return [], {}
@@ -81,8 +72,8 @@ def display_manual_review_summary(manual_jobs, summary):
     
     # Load original job data for context
     try:
-        with open('temp-scraped-jobs.json', 'r') as f:
-            jobs_data = json.load(f)
+        with open('temp-scraped-jobs.json', 'rb') as f:
+            jobs_data = orjson.loads(f.read())
             job_lookup = {job['job_url']: job for job in jobs_data}
     except:
         job_lookup = {}
@@ -130,8 +121,8 @@ def display_manual_review_summary(manual_jobs, summary):
     print(f"4. Make your decision based on the actual job posting content")
     
     # Save manual review list for reference
-    with open('manual-review-list.json', 'w') as f:
-        json.dump({
+    with open('manual-review-list.json', 'wb') as f:
+        f.write(orjson.dumps({
             'summary': summary,
             'manual_review_jobs': manual_jobs,
             'generated_at': summary.get('verified_at'),
@@ -139,7 +130,7 @@ def display_manual_review_summary(manual_jobs, summary):
                 'accept_if': ['Contract position', 'Freelance work', '1099 contractor', 'Temporary assignment', 'Hourly rate mentioned'],
                 'reject_if': ['Permanent employee', 'Full-time with benefits', 'W-2 only', 'Employee health insurance', 'Salary position']
             }
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2))
     
     print(f"\n💾 Manual review list saved to: manual-review-list.json")
 
@@ -3,111 +3,202 @@
 Finalize job imports by combining automated accepts + manual review accepts
 """
 
-import json
+import hashlib
+import os
+import subprocess
+import tempfile
+import time
 from datetime import datetime
 
+import numpy as np
+import orjson
+import pandas as pd
+
+# Verification results are cached by a hash of the job URL + description, so
+# postings that reappear in later scrapes are not sent through the verifier again
+VERIFICATION_CACHE_PATH = '/root/contracts-only/scripts/.verification_cache.json'
+VERIFICATION_CACHE_TTL_SECONDS = 30 * 24 * 3600
+CACHED_RESULT_FIELDS = ('recommendation', 'final_score', 'verification_method',
+                        'confidence_level', 'contract_indicators', 'verified_at')
+# Results that are not cached: verifier errors, and SCRAPING_ONLY, which is also
+# what a failed or empty page fetch falls back to (with no error_message set)
+UNCACHED_VERIFICATION_METHODS = frozenset({'SCRAPING_ONLY', 'ERROR'})
+
+# Fields added to each accepted job from its verification result
+VERIFICATION_FIELDS = ['verification_score', 'verification_method', 'confidence_level',
+                       'contract_indicators', 'verified_at']
+
+# Accepted jobs are written a chunk of rows at a time
+JSON_WRITE_CHUNK_ROWS = 500
+
+def job_content_key(job):
+    """Cache key for a job: SHA-256 of its URL and description"""
+    content = (job.get('job_url') or '') + (job.get('description') or '')
+    return hashlib.sha256(content.encode()).hexdigest()
+
+def load_verification_cache():
+    """Load cached verification results, dropping entries past the TTL"""
+    try:
+        with open(VERIFICATION_CACHE_PATH, 'rb') as f:
+            cache = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    cutoff = time.time() - VERIFICATION_CACHE_TTL_SECONDS
+    return {key: entry for key, entry in cache.items() if entry.get('cached_at', 0) >= cutoff}
+
+def save_verification_cache(cache):
+    with open(VERIFICATION_CACHE_PATH, 'wb') as f:
+        f.write(orjson.dumps(cache))
+
+def run_verifier(jobs):
+    """Run the enhanced verifier on the given jobs and return its results, in job order"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs_path = os.path.join(tmp_dir, 'jobs-to-verify.json')
+        results_path = os.path.join(tmp_dir, 'verification-results.json')
+        with open(jobs_path, 'wb') as f:
+            f.write(orjson.dumps(jobs, default=str))
+        subprocess.run([
+            'bash', '-c', 
+            'source ../job-scraper-env/bin/activate && python3 enhanced-job-verifier.py "$0" --json-output-file "$1"',
+            jobs_path, results_path
+        ], stdout=subprocess.DEVNULL, check=True, timeout=300, cwd='/root/contracts-only/scripts')
+        
+        with open(results_path, 'rb') as f:
+            return orjson.loads(f.read())['results']
+
+# Shared with jobspy-scraper.py; keep the two copies byte-identical
+def json_default(value):
+    """Serialize values orjson doesn't handle natively (pandas timestamps and missing values)"""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+def write_json_records(path, frame):
+    """Write a DataFrame as a JSON array, one record per line, a chunk of rows at a time"""
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        separator = b'\n'
+        for start in range(0, len(frame), JSON_WRITE_CHUNK_ROWS):
+            for record in frame.iloc[start:start + JSON_WRITE_CHUNK_ROWS].to_dict('records'):
+                f.write(separator)
+                f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY, default=json_default))
+                separator = b',\n'
+        f.write(b'\n]\n')
+
 def finalize_imports():
     print("📦 FINALIZING JOB IMPORTS")
     print("=" * 50)
     
-    # Load verification results 
+    # Load original job data
     try:
-        # Run verification to get latest results
-        import subprocess
-        result = subprocess.run([
-            'bash', '-c', 
-            'source ../job-scraper-env/bin/activate && python3 enhanced-job-verifier.py temp-scraped-jobs.json'
-        ], capture_output=True, text=True, timeout=300, cwd='/root/contracts-only/scripts')
-        
-        # Extract JSON from output
-        output_lines = result.stdout.strip().split('\n')
-        json_start = -1
-        json_end = -1
-        brace_count = 0
-        
-        for i, line in enumerate(output_lines):
-            if line.strip().startswith('{') and json_start == -1:
-                json_start = i
-                brace_count = 1
-            elif json_start != -1:
-                brace_count += line.count('{') - line.count('}')
-                if brace_count == 0:
-                    json_end = i
-                    break
-        
-        json_text = '\n'.join(output_lines[json_start:json_end+1])
-        verification_data = json.loads(json_text)
-        
+        with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'rb') as f:
+            jobs_data = orjson.loads(f.read())
     except Exception as e:
-        print(f"❌ Error loading verification results: {e}")
+        print(f"❌ Error loading job data: {e}")
         return
     
-    # Load original job data
+    if not jobs_data:
+        print("❌ No scraped jobs to finalize")
+        return
+    
+    # Load verification results, verifying only jobs not already in the cache
     try:
-        with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'r') as f:
-            jobs_data = json.load(f)
-            job_lookup = {job['job_url']: job for job in jobs_data}
+        cache = load_verification_cache()
+        job_keys = [job_content_key(job) for job in jobs_data]
+        misses = {}
+        for job, key in zip(jobs_data, job_keys):
+            if key not in cache:
+                misses.setdefault(key, job)
+        print(f"🗃️ Verification cache: {len(jobs_data) - len(misses)} hit(s), {len(misses)} job(s) to verify")
+        
+        fresh = {}
+        if misses:
+            # Results come back in input order; pair them by position, since jobs
+            # sharing a URL with different descriptions have different keys
+            now = time.time()
+            for key, result in zip(misses, run_verifier(list(misses.values())), strict=True):
+                fresh[key] = {field: result[field] for field in CACHED_RESULT_FIELDS}
+                # Errors and failed fetches are retried on the next run rather than cached
+                if result['verification_method'] not in UNCACHED_VERIFICATION_METHODS and not result.get('error_message'):
+                    cache[key] = dict(fresh[key], cached_at=now)
+            save_verification_cache(cache)
+        
+        verification_results = []
+        unverified = []
+        for job, key in zip(jobs_data, job_keys):
+            result = fresh.get(key) or cache.get(key)
+            if result:
+                verification_results.append(dict(result, url=job.get('job_url', '')))
+            else:
+                unverified.append(job.get('job_url', ''))
+        if unverified:
+            print(f"⚠️ {len(unverified)} job(s) had no verification result and were skipped:")
+            for url in unverified:
+                print(f"   - {url}")
+        
     except Exception as e:
-        print(f"❌ Error loading job data: {e}")
+        print(f"❌ Error loading verification results: {e}")
         return
     
     # Load manual decisions
     try:
-        with open('/root/contracts-only/scripts/manual-review-decisions.json', 'r') as f:
-            manual_decisions = json.load(f)
+        with open('/root/contracts-only/scripts/manual-review-decisions.json', 'rb') as f:
+            manual_decisions = orjson.loads(f.read())
             manual_accepts = {d['url'] for d in manual_decisions['decisions'] if d['manual_decision'] == 'ACCEPT'}
     except Exception as e:
         print("ℹ️ No manual decisions found")
         manual_accepts = set()
     
-    # Collect all accepted jobs
-    accepted_jobs = []
-    auto_accepts = 0
-    manual_review_accepts = 0
+    # Collect all accepted jobs: auto-accepts plus manual reviews a human accepted
+    results_df = pd.DataFrame(verification_results, columns=['url', *CACHED_RESULT_FIELDS])
+    is_auto = results_df['recommendation'] == 'ACCEPT'
+    is_manual = (results_df['recommendation'] == 'MANUAL_REVIEW') & results_df['url'].isin(manual_accepts)
+    accepted_results = pd.DataFrame({
+        'job_url': results_df['url'],
+        'verification_score': results_df['final_score'],
+        'verification_method': np.where(is_auto, results_df['verification_method'], 'MANUAL_REVIEW_ACCEPTED'),
+        'confidence_level': np.where(is_auto, results_df['confidence_level'], 'HUMAN_VERIFIED'),
+        'contract_indicators': results_df['contract_indicators'],
+        'verified_at': results_df['verified_at'],
+        'auto_accepted': is_auto,
+    })[is_auto | is_manual]
     
-    for result in verification_data['results']:
-        url = result['url']
-        
-        # Auto-accepted jobs
-        if result['recommendation'] == 'ACCEPT':
-            if url in job_lookup:
-                job = job_lookup[url].copy()
-                job['verification_score'] = result['final_score']
-                job['verification_method'] = result['verification_method']
-                job['confidence_level'] = result['confidence_level']
-                job['contract_indicators'] = result['contract_indicators']
-                job['verified_at'] = result['verified_at']
-                accepted_jobs.append(job)
-                auto_accepts += 1
-        
-        # Manual review jobs that were accepted
-        elif result['recommendation'] == 'MANUAL_REVIEW' and url in manual_accepts:
-            if url in job_lookup:
-                job = job_lookup[url].copy()
-                job['verification_score'] = result['final_score']
-                job['verification_method'] = 'MANUAL_REVIEW_ACCEPTED'
-                job['confidence_level'] = 'HUMAN_VERIFIED'
-                job['contract_indicators'] = result['contract_indicators']
-                job['verified_at'] = result['verified_at']
-                accepted_jobs.append(job)
-                manual_review_accepts += 1
+    # Attach the scraped job fields (later duplicates of a URL win, as before);
+    # dtype=object keeps the scraped values exactly as loaded
+    jobs_df = pd.DataFrame(jobs_data, dtype=object).drop_duplicates(subset='job_url', keep='last')
+    job_columns = [c for c in jobs_df.columns if c not in VERIFICATION_FIELDS]
+    accepted = accepted_results.merge(jobs_df[job_columns], on='job_url', how='inner')
+    
+    auto_accepts = int(accepted.pop('auto_accepted').sum())
+    manual_review_accepts = len(accepted) - auto_accepts
+    accepted_jobs = accepted[[*job_columns, *VERIFICATION_FIELDS]]
     
     # Save final accepted jobs
-    with open('/root/contracts-only/scripts/final-accepted-jobs.json', 'w') as f:
-        json.dump(accepted_jobs, f, indent=2, default=str)
+    write_json_records('/root/contracts-only/scripts/final-accepted-jobs.json', accepted_jobs)
+    
+    # Source breakdown
+    if 'source_platform' in accepted_jobs:
+        sources = accepted_jobs['source_platform']
+    else:
+        sources = pd.Series('unknown', index=accepted_jobs.index)
+    source_breakdown = {source: int(count) for source, count in sources.value_counts(sort=False).items()}
     
     # Generate summary
+    total_jobs = len(jobs_data)
+    manual_review_total = sum(1 for r in verification_results if r['recommendation'] == 'MANUAL_REVIEW')
     summary = {
         'import_summary': {
-            'total_jobs_processed': verification_data['verification_summary']['total_jobs'],
+            'total_jobs_processed': total_jobs,
             'auto_accepted': auto_accepts,
             'manual_review_accepted': manual_review_accepts,
             'total_accepted': len(accepted_jobs),
-            'acceptance_rate': f"{len(accepted_jobs)/verification_data['verification_summary']['total_jobs']*100:.1f}%",
-            'manual_review_rate': f"{verification_data['verification_summary']['manual_review']/verification_data['verification_summary']['total_jobs']*100:.1f}%",
+            'acceptance_rate': f"{len(accepted_jobs)/total_jobs*100:.1f}%",
+            'manual_review_rate': f"{manual_review_total/total_jobs*100:.1f}%",
             'finalized_at': datetime.now().isoformat()
         },
-        'source_breakdown': {},
+        'source_breakdown': source_breakdown,
         'next_steps': [
             "Review final-accepted-jobs.json",
             "Import to database using: node scripts/job-seeder.js --import-verified final-accepted-jobs.json",
@@ -115,11 +206,6 @@ def finalize_imports():
         ]
     }
     
-    # Source breakdown
-    for job in accepted_jobs:
-        source = job.get('source_platform', 'unknown')
-        summary['source_breakdown'][source] = summary['source_breakdown'].get(source, 0) + 1
-    
     print("📊 FINAL IMPORT SUMMARY:")
     print("=" * 40)
     print(f"Total Jobs Processed: {summary['import_summary']['total_jobs_processed']}")
@@ -142,8 +228,8 @@ def finalize_imports():
         print(f"   • {step}")
     
     # Save summary
-    with open('/root/contracts-only/scripts/import-summary.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+    with open('/root/contracts-only/scripts/import-summary.json', 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     
     print(f"\n✅ Job import preparation completed successfully!")
 
@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
+import os
 import sys
-import json
 import time
 import re
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from jobspy import scrape_jobs
 from datetime import datetime
+import orjson
 import pandas as pd
-import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-keyword substring scans
 
 # Enhanced configuration for multi-source scraping
 SCRAPING_CONFIG = {
@@ -14,6 +22,10 @@ SCRAPING_CONFIG = {
         'enabled': True,
         'results_per_term': 40,
         'delay': 1,  # seconds between requests
+        'max_workers': 4,  # search terms fetched concurrently
+        # Opt-in: one OR query instead of one request per term. search_term is then
+        # guessed by match_search_terms rather than being the query that found the job
+        'combine_terms': False,
         'search_terms': [
             "independent contractor software",
             "contract-to-hire developer remote",
@@ -29,6 +41,8 @@ SCRAPING_CONFIG = {
         'enabled': True,
         'results_per_term': 20,  # Conservative due to rate limits
         'delay': 3,  # Longer delay for LinkedIn
+        'max_workers': 2,
+        'combine_terms': False,
         'search_terms': [
             "independent contractor developer",
             "contract-to-hire software",
@@ -40,6 +54,8 @@ SCRAPING_CONFIG = {
         'enabled': False,  # Disabled due to consistent 400 errors
         'results_per_term': 30,
         'delay': 2,
+        'max_workers': 2,
+        'combine_terms': False,
         'search_terms': [
             "independent contractor programming",
             "contract-to-hire developer",
@@ -49,6 +65,12 @@ SCRAPING_CONFIG = {
     }
 }
 
+# Scrape results are cached on disk by (source, query, results wanted) so
+# reruns within the TTL skip the network; set JOBSPY_CACHE_TTL=0 to disable
+SCRAPE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.jobspy_cache')
+SCRAPE_CACHE_TTL_SECONDS = int(os.getenv("JOBSPY_CACHE_TTL", "3600"))
+SCRAPE_CACHE_LOCK = threading.Lock()  # sources scrape on separate threads; shelve has no locking
+
 # Enhanced contract keywords with weights
 CONTRACT_KEYWORDS = {
     # High confidence contract indicators
@@ -109,56 +131,121 @@ MEDIUM_EXCLUDE_KEYWORDS = {
     'direct hire': 2
 }
 
+# Keyword weights pre-scaled for calculate_contract_score: contract indicators
+# count 0.1 per weight point, strong exclusions 0.15 (higher penalty) and
+# medium exclusions 0.05 (lower penalty)
+CONTRACT_WEIGHTS = tuple((keyword, weight * 0.1) for keyword, weight in CONTRACT_KEYWORDS.items())
+STRONG_EXCLUDE_WEIGHTS = tuple((keyword, weight * 0.15) for keyword, weight in STRONG_EXCLUDE_KEYWORDS.items())
+MEDIUM_EXCLUDE_WEIGHTS = tuple((keyword, weight * 0.05) for keyword, weight in MEDIUM_EXCLUDE_KEYWORDS.items())
+
+# Explicit job_type values: rejected outright, or accepted without keyword scoring
+REJECT_JOB_TYPES = frozenset({'fulltime', 'full-time', 'full_time', 'permanent', 'employee', 'staff'})
+CONTRACT_JOB_TYPES = frozenset({'contract', 'contractor', 'freelance', 'temp', 'temporary', 'consultant'})
+
+# Every scored keyword, matched together in one pass over the text
+ALL_KEYWORDS = tuple(dict.fromkeys(
+    list(CONTRACT_KEYWORDS) + list(STRONG_EXCLUDE_KEYWORDS) + list(MEDIUM_EXCLUDE_KEYWORDS)
+))
+
+def build_keyword_automaton():
+    """Build an Aho-Corasick automaton over every scored keyword"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+def find_keywords(text):
+    """Return the set of scored keywords that occur in the (lowercased) text"""
+    if KEYWORD_AUTOMATON is None:
+        return {keyword for keyword in ALL_KEYWORDS if keyword in text}
+    return {keyword for _, keyword in KEYWORD_AUTOMATON.iter(text)}
+
+# Scoring patterns, matched against already-lowercased text
+HOURLY_RE = re.compile(r'\$\d+.*(?:/hr|/hour|per hour|hourly)')
+HOURLY_RATE_RE = re.compile(r'hourly.*rate|rate.*hourly')
+DURATION_CONTRACT_RE = re.compile(r'\d+\s*(?:month|week|months|weeks)\s*(?:contract|project|assignment)')
+DURATION_ANY_RE = re.compile(r'\d+\s*(?:month|week|months|weeks)')
+JOB_TYPE_FULL_TIME_RE = re.compile(r'job\s*type\s*:?\s*full[-\s]*time|employment\s*type\s*:?\s*full[-\s]*time')
+JOB_TYPE_PERMANENT_RE = re.compile(r'job\s*type\s*:?\s*permanent|employment\s*type\s*:?\s*permanent')
+JOB_TYPE_CONTRACT_RE = re.compile(r'job\s*type\s*:?\s*contract|employment\s*type\s*:?\s*contract')
+JOB_TYPE_TEMP_RE = re.compile(r'job\s*type\s*:?\s*(?:temp|temporary|freelance)')
+
+# Largest total of the hourly (0.3), duration (0.2) and job type (0.4) bonuses,
+# and the float tolerance used when comparing against it
+MAX_REGEX_BONUS = 0.3 + 0.2 + 0.4
+SCORE_EPSILON = 1e-9
+
+# Output is written a chunk of rows at a time, so the whole result set never
+# exists as one list of dicts plus one JSON buffer
+JSON_WRITE_CHUNK_ROWS = 500
+
+# Hourly rate patterns for extract_rate_range, tried in order: ranges ($50-$75/hr)
+# before single rates ($60/hr), and dollar-prefixed before bare numbers.
+# Each is paired with whether it needs a "$" in the text to match at all.
+RATE_PATTERNS = (
+    (True, re.compile(r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour)')),
+    (True, re.compile(r'\$(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour)')),
+    (False, re.compile(r'(\d+(?:\.\d{2})?)\s*-\s*(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour)')),
+    (False, re.compile(r'(\d+(?:\.\d{2})?)[\s/]*(?:hr|hour)')),
+)
+
 def calculate_contract_score(description, title=""):
     """Calculate enhanced contract relevance score (0-1) with weighted keywords"""
     if not description:
         return 0
+    return score_contract_text((description + " " + title).lower())
+
+def score_contract_text(text):
+    """Contract relevance score (0-1) of an already-lowercased description + title"""
+    found = find_keywords(text)
+    
+    # Sum the scaled weights of the keywords present, in dictionary order
+    positive_score = sum(weight for keyword, weight in CONTRACT_WEIGHTS if keyword in found)
+    strong_negative_score = sum(weight for keyword, weight in STRONG_EXCLUDE_WEIGHTS if keyword in found)
+    medium_negative_score = sum(weight for keyword, weight in MEDIUM_EXCLUDE_WEIGHTS if keyword in found)
+    
+    # Lowest possible result: exclusion-heavy jobs with no contract terms are
+    # floored at 0.1, everything else at 0. When even the maximum regex bonus
+    # can't lift the score above that floor, skip the regex scans.
+    floor_score = 0.1 if strong_negative_score > 0.4 and positive_score < 0.2 else 0.0
+    best_case_score = positive_score + MAX_REGEX_BONUS - strong_negative_score - medium_negative_score
+    if best_case_score < floor_score - SCORE_EPSILON:
+        return floor_score
+    
+    # Check for explicit job type mentions; a full-time/permanent penalty
+    # often settles the score on its own, so it is checked first
+    job_type_penalty = 0
+    if JOB_TYPE_FULL_TIME_RE.search(text):
+        job_type_penalty = 0.5
+    elif JOB_TYPE_PERMANENT_RE.search(text):
+        job_type_penalty = 0.4
     
-    text = (description + " " + title).lower()
-    
-    # Calculate positive score from contract indicators
-    positive_score = 0
-    for keyword, weight in CONTRACT_KEYWORDS.items():
-        if keyword in text:
-            positive_score += weight * 0.1  # Scale weights to reasonable values
-    
-    # Calculate negative score from strong exclusion terms
-    strong_negative_score = 0
-    for keyword, weight in STRONG_EXCLUDE_KEYWORDS.items():
-        if keyword in text:
-            strong_negative_score += weight * 0.15  # Higher penalty for strong indicators
-    
-    # Calculate negative score from medium exclusion terms
-    medium_negative_score = 0
-    for keyword, weight in MEDIUM_EXCLUDE_KEYWORDS.items():
-        if keyword in text:
-            medium_negative_score += weight * 0.05  # Lower penalty for medium indicators
+    if best_case_score - job_type_penalty < floor_score - SCORE_EPSILON:
+        return floor_score
     
     # Bonus for hourly rate mentions (strong contract indicator)
     hourly_bonus = 0
-    if re.search(r'\$\d+.*(?:/hr|/hour|per hour|hourly)', text):
+    if HOURLY_RE.search(text):
         hourly_bonus = 0.3
-    elif re.search(r'hourly.*rate|rate.*hourly', text):
+    elif HOURLY_RATE_RE.search(text):
         hourly_bonus = 0.2
     
     # Bonus for duration mentions (contracts have specific durations)
     duration_bonus = 0
-    if re.search(r'\d+\s*(?:month|week|months|weeks)\s*(?:contract|project|assignment)', text):
+    if DURATION_CONTRACT_RE.search(text):
         duration_bonus = 0.2
-    elif re.search(r'\d+\s*(?:month|week|months|weeks)', text):
+    elif DURATION_ANY_RE.search(text):
         duration_bonus = 0.1
     
-    # Check for explicit job type mentions
-    job_type_penalty = 0
-    if re.search(r'job\s*type\s*:?\s*full[-\s]*time', text) or re.search(r'employment\s*type\s*:?\s*full[-\s]*time', text):
-        job_type_penalty = 0.5
-    elif re.search(r'job\s*type\s*:?\s*permanent', text) or re.search(r'employment\s*type\s*:?\s*permanent', text):
-        job_type_penalty = 0.4
-    
     job_type_bonus = 0
-    if re.search(r'job\s*type\s*:?\s*contract', text) or re.search(r'employment\s*type\s*:?\s*contract', text):
+    if JOB_TYPE_CONTRACT_RE.search(text):
         job_type_bonus = 0.4
-    elif re.search(r'job\s*type\s*:?\s*(?:temp|temporary|freelance)', text):
+    elif JOB_TYPE_TEMP_RE.search(text):
         job_type_bonus = 0.3
     
     # Calculate final score
@@ -178,157 +265,250 @@ def extract_rate_range(text):
     """Extract hourly rate range from text"""
     if not text:
         return None, None
+    return find_rate_range(text.lower())
+
+def find_rate_range(text):
+    """Hourly rate range in already-lowercased text"""
+    # Every pattern ends in "hr" or "hour", and the first two need a "$"
+    if 'hr' not in text and 'hour' not in text:
+        return None, None
+    has_dollar = '$' in text
     
-    # Pattern for hourly rates
-    rate_patterns = [
-        r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour)',
-        r'\$(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour)',
-        r'(\d+(?:\.\d{2})?)\s*-\s*(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour)',
-        r'(\d+(?:\.\d{2})?)\s*(?:/|\s)*(?:hr|hour)'
-    ]
-    
-    for pattern in rate_patterns:
-        matches = re.findall(pattern, text.lower())
-        if matches:
-            match = matches[0]
-            if isinstance(match, tuple) and len(match) == 2:
-                try:
-                    return float(match[0]), float(match[1])
-                except ValueError:
-                    continue
-            elif isinstance(match, str):
-                try:
-                    rate = float(match)
-                    return rate, rate
-                except ValueError:
-                    continue
+    for needs_dollar, pattern in RATE_PATTERNS:
+        if needs_dollar and not has_dollar:
+            continue
+        match = pattern.search(text)
+        if match:
+            # Single-rate patterns have one group, so the rate is both ends
+            rates = match.groups()
+            return float(rates[0]), float(rates[-1])
     
     return None, None
 
-def scrape_jobs_from_source(source_name, config, limit_per_term):
-    """Scrape jobs from a specific source"""
-    print(f"\n📡 Scraping from {source_name.upper()}")
-    
-    if not config['enabled']:
-        print(f"❌ {source_name} is disabled")
-        return []
-    
-    all_jobs = []
-    
-    for term in config['search_terms']:
-        print(f"  🔍 Searching: '{term}'")
-        
-        try:
-            # Rate limiting
-            if config['delay'] > 0:
-                time.sleep(config['delay'])
+class RateLimiter:
+    """Space out request starts to at most one per `interval` seconds, across threads"""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = time.monotonic()
+    
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        time.sleep(start - now)
+
+def load_cached_scrape(key):
+    """Return (jobs, scraped_at) cached for this query within the TTL, or None"""
+    if SCRAPE_CACHE_TTL_SECONDS <= 0:
+        return None
+    try:
+        with SCRAPE_CACHE_LOCK, shelve.open(SCRAPE_CACHE_PATH) as cache:
+            hit = cache.get(key)
+        if hit and time.time() - hit['ts'] < SCRAPE_CACHE_TTL_SECONDS:
+            return hit['jobs'], hit['scraped_at']
+    except Exception as e:
+        # An unreadable cache only costs a live scrape
+        print(f"    ⚠️  Scrape cache read failed, scraping live: {e}")
+    return None
+
+def store_cached_scrape(key, jobs, scraped_at):
+    """Cache a query's results; failures are logged and the fresh results still used"""
+    if SCRAPE_CACHE_TTL_SECONDS <= 0:
+        return
+    try:
+        with SCRAPE_CACHE_LOCK, shelve.open(SCRAPE_CACHE_PATH) as cache:
+            cache[key] = {'ts': time.time(), 'jobs': jobs, 'scraped_at': scraped_at}
+    except Exception as e:
+        print(f"    ⚠️  Scrape cache write failed: {e}")
+
+def scrape_term(source_name, term, results_wanted, limiter):
+    """Scrape one search term (or combined query) from a source"""
+    print(f"  🔍 Searching: '{term}'")
+    
+    try:
+        cache_key = repr((source_name, term, results_wanted))
+        cached = load_cached_scrape(cache_key)
+        if cached is not None:
+            jobs, scraped_at = cached
+            print(f"    ♻️  Using cached results from {scraped_at}")
+        else:
+            # Rate limiting, shared by all of this source's terms
+            limiter.wait()
             
             jobs = scrape_jobs(
                 site_name=[source_name],
                 search_term=term,
                 location="United States",
-                results_wanted=min(limit_per_term, config['results_per_term']),
+                results_wanted=results_wanted,
                 hours_old=168,  # Last week
                 country_indeed='USA',
                 job_type='contract'  # Force contract jobs only
             )
-            
+            scraped_at = datetime.now().isoformat()
             if len(jobs) > 0:
-                jobs_dict = jobs.to_dict('records')
-                
-                # Add source information
-                for job in jobs_dict:
-                    job['source_platform'] = source_name
-                    job['search_term'] = term
-                    job['scraped_at'] = datetime.now().isoformat()
-                
-                all_jobs.extend(jobs_dict)
-                print(f"    ✅ Found {len(jobs)} jobs")
-            else:
-                print(f"    ❌ No jobs found")
-                
-        except Exception as e:
-            print(f"    ❌ Error scraping '{term}' from {source_name}: {e}")
-            continue
+                store_cached_scrape(cache_key, jobs, scraped_at)
+        
+        if len(jobs) > 0:
+            # Add source information
+            jobs = jobs.assign(
+                source_platform=source_name,
+                search_term=term,
+                scraped_at=scraped_at
+            )
+            
+            print(f"    ✅ Found {len(jobs)} jobs for '{term}'")
+            return jobs
+        else:
+            print(f"    ❌ No jobs found for '{term}'")
+            return pd.DataFrame()
+            
+    except Exception as e:
+        print(f"    ❌ Error scraping '{term}' from {source_name}: {e}")
+        return pd.DataFrame()
+
+def scrape_jobs_from_source(source_name, config, limit_per_term):
+    """Scrape jobs from a specific source, several search terms at a time"""
+    print(f"\n📡 Scraping from {source_name.upper()}")
+    
+    if not config['enabled']:
+        print(f"❌ {source_name} is disabled")
+        return pd.DataFrame()
+    
+    limiter = RateLimiter(config['delay'])
+    search_terms = config['search_terms']
+    results_per_term = min(limit_per_term, config['results_per_term'])
+    
+    if config.get('combine_terms'):
+        # One request for every term; search_term is a heuristic guess, not the query that matched
+        query = ' OR '.join(f'({term})' for term in search_terms)
+        all_jobs = scrape_term(source_name, query, results_per_term * len(search_terms), limiter)
+        if not all_jobs.empty:
+            all_jobs['search_term'] = match_search_terms(all_jobs, search_terms)
+    else:
+        with ThreadPoolExecutor(max_workers=config.get('max_workers', 1)) as executor:
+            futures = [
+                executor.submit(scrape_term, source_name, term, results_per_term, limiter)
+                for term in search_terms
+            ]
+            # Collect in search-term order so deduplication keeps the same first occurrence
+            all_jobs = concat_frames([future.result() for future in futures])
     
     print(f"📊 Total from {source_name}: {len(all_jobs)} jobs")
     return all_jobs
 
+def match_search_terms(jobs, search_terms):
+    """For each job, the search term sharing the most words with its title and description
+    
+    This is a word-overlap guess; ties go to the term listed first.
+    """
+    term_words = [(term, term.lower().split()) for term in search_terms]
+    texts = (text_column(jobs, 'title') + " " + text_column(jobs, 'description')).str.lower()
+    return [
+        max(term_words, key=lambda term_and_words: sum(word in text for word in term_and_words[1]))[0]
+        for text in texts
+    ]
+
+def concat_frames(frames):
+    """Concatenate scraped DataFrames, skipping empty ones"""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+def text_column(df, name):
+    """Column as strings (like str(job.get(name, ''))), or empty strings if missing"""
+    if name not in df:
+        return pd.Series('', index=df.index)
+    return df[name].map(str)
+
 def process_and_filter_jobs(all_jobs, min_contract_score=0.3):
-    """Process and filter scraped jobs"""
+    """Process and filter a DataFrame of scraped jobs"""
     print(f"\n🔄 Processing {len(all_jobs)} raw jobs...")
     
     # Remove duplicates by job URL
-    seen_urls = set()
-    unique_jobs = []
-    
-    for job in all_jobs:
-        job_url = job.get('job_url', '')
-        if job_url and job_url not in seen_urls:
-            seen_urls.add(job_url)
-            unique_jobs.append(job)
-    
-    print(f"📋 After deduplication: {len(unique_jobs)} unique jobs")
-    
-    # Filter and score jobs
-    filtered_jobs = []
-    explicit_rejects = 0
-    
-    for job in unique_jobs:
-        # EXPLICIT JOB TYPE REJECTION - Check job_type field first
-        job_type = str(job.get('job_type', '')).lower().strip()
-        if job_type in ['fulltime', 'full-time', 'full_time', 'permanent', 'employee', 'staff']:
-            explicit_rejects += 1
-            continue
-            
-        # EXPLICIT JOB TYPE ACCEPTANCE - Skip scoring if already confirmed contract
-        explicit_contract = job_type in ['contract', 'contractor', 'freelance', 'temp', 'temporary', 'consultant']
-        
-        if explicit_contract:
-            # Skip keyword scoring for explicitly marked contract jobs
-            contract_score = 0.8  # High confidence for explicit contract jobs
+    job_urls = all_jobs['job_url'] if 'job_url' in all_jobs else pd.Series(None, index=all_jobs.index)
+    jobs = all_jobs[job_urls.notna() & (job_urls != '')].drop_duplicates(subset='job_url')
+    
+    print(f"📋 After deduplication: {len(jobs)} unique jobs")
+    
+    # EXPLICIT JOB TYPE REJECTION - Check job_type field first
+    job_type = text_column(jobs, 'job_type').str.lower().str.strip()
+    rejected = job_type.isin(REJECT_JOB_TYPES)
+    explicit_rejects = int(rejected.sum())
+    jobs = jobs[~rejected]
+    job_type = job_type[~rejected]
+    
+    # Skip jobs missing required fields (empty or NaN) before any per-row work
+    has_required = pd.Series(True, index=jobs.index)
+    for field in ('title', 'company'):
+        has_required &= (jobs[field].notna() & jobs[field].map(bool)) if field in jobs else False
+    jobs = jobs[has_required]
+    job_type = job_type[has_required]
+    
+    # EXPLICIT JOB TYPE ACCEPTANCE - Skip scoring if already confirmed contract
+    explicit_contract = job_type.isin(CONTRACT_JOB_TYPES)
+    
+    # Lowercase each text column once; scoring and rate extraction share the description
+    descriptions = text_column(jobs, 'description').map(str.lower)
+    texts = descriptions + " " + text_column(jobs, 'title').map(str.lower)
+    compensations = text_column(jobs, 'compensation').map(str.lower)
+    
+    # Score, filter and extract rates in a single pass over the remaining rows
+    keep = []
+    contract_scores = []
+    rates = []
+    for is_contract, description, text, compensation in zip(explicit_contract, descriptions, texts, compensations):
+        # Explicit contract jobs get high confidence; unclear job types are keyword-scored
+        if is_contract:
+            score = 0.8
         else:
-            # Calculate contract score for unclear job types
-            description = str(job.get('description', ''))
-            title = str(job.get('title', ''))
-            contract_score = calculate_contract_score(description, title)
+            score = score_contract_text(text) if description else 0
         
         # Skip jobs with low contract relevance (only applies to keyword-scored jobs)
-        if not explicit_contract and contract_score < min_contract_score:
+        if not is_contract and score < min_contract_score:
+            keep.append(False)
             continue
         
-        # Extract rate information
-        salary_text = str(job.get('compensation', '')) + " " + description
-        min_rate, max_rate = extract_rate_range(salary_text)
-        
-        # Add computed fields
-        job['contract_score'] = round(contract_score, 2)
-        job['hourly_rate_min'] = min_rate
-        job['hourly_rate_max'] = max_rate
-        
-        # Ensure required fields are present
-        if not job.get('title'):
-            continue
-        if not job.get('company'):
-            continue
-            
-        filtered_jobs.append(job)
+        keep.append(True)
+        contract_scores.append(round(score, 2))
+        rates.append(find_rate_range(compensation + " " + description))
+    
+    # Add computed fields
+    filtered_jobs = jobs.loc[keep].assign(
+        contract_score=contract_scores,
+        hourly_rate_min=[min_rate for min_rate, _ in rates],
+        hourly_rate_max=[max_rate for _, max_rate in rates]
+    )
     
     print(f"🚫 Explicit job type rejections: {explicit_rejects}")
     print(f"✅ After filtering: {len(filtered_jobs)} contract-relevant jobs")
     return filtered_jobs
 
-def clean_job_data(job):
-    """Clean job data for JSON serialization"""
-    cleaned = {}
-    for key, value in job.items():
-        if pd.isna(value) or (isinstance(value, float) and np.isnan(value)):
-            cleaned[key] = None
-        elif isinstance(value, (pd.Timestamp, datetime)):
-            cleaned[key] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
-        else:
-            cleaned[key] = value
-    return cleaned
+# Shared with finalize-job-imports.py; keep the two copies byte-identical
+def json_default(value):
+    """Serialize values orjson doesn't handle natively (pandas timestamps and missing values)"""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+def write_json_records(path, frame):
+    """Write a DataFrame as a JSON array, one record per line, a chunk of rows at a time"""
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        separator = b'\n'
+        for start in range(0, len(frame), JSON_WRITE_CHUNK_ROWS):
+            for record in frame.iloc[start:start + JSON_WRITE_CHUNK_ROWS].to_dict('records'):
+                f.write(separator)
+                f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY, default=json_default))
+                separator = b',\n'
+        f.write(b'\n]\n')
 
 def main():
     limit = int(sys.argv[1]) if len(sys.argv) > 1 else 300
@@ -338,42 +518,36 @@ def main():
     print(f"📋 Target: {limit} jobs maximum")
     print(f"🎯 Min contract score: {min_score}")
     
-    all_jobs = []
-    
     # Calculate jobs per source
     sources = [name for name, config in SCRAPING_CONFIG.items() if config['enabled']]
     jobs_per_source = limit // len(sources) if sources else 0
     
-    # Scrape from each enabled source
-    for source_name, config in SCRAPING_CONFIG.items():
-        source_jobs = scrape_jobs_from_source(source_name, config, jobs_per_source)
-        all_jobs.extend(source_jobs)
+    # Scrape all sources concurrently; each source keeps its own rate limit
+    with ThreadPoolExecutor(max_workers=len(SCRAPING_CONFIG)) as executor:
+        futures = [
+            executor.submit(scrape_jobs_from_source, source_name, config, jobs_per_source)
+            for source_name, config in SCRAPING_CONFIG.items()
+        ]
+        all_jobs = concat_frames([future.result() for future in futures])
     
-    if not all_jobs:
+    if all_jobs.empty:
         print("❌ No jobs scraped from any source")
         return
     
     # Process and filter jobs
     processed_jobs = process_and_filter_jobs(all_jobs, min_score)
     
-    # Clean data for JSON serialization
-    cleaned_jobs = [clean_job_data(job) for job in processed_jobs]
-    
-    # Save results
+    # Save results; orjson writes NaN as null and numpy values natively
     output_file = '/root/contracts-only/scripts/temp-scraped-jobs.json'
-    with open(output_file, 'w') as f:
-        json.dump(cleaned_jobs, f, indent=2, default=str)
+    write_json_records(output_file, processed_jobs)
     
     # Generate summary
-    source_stats = {}
-    for job in cleaned_jobs:
-        source = job.get('source_platform', 'unknown')
-        source_stats[source] = source_stats.get(source, 0) + 1
+    source_stats = processed_jobs['source_platform'].value_counts(sort=False)
     
     print(f"\n📊 SCRAPING SUMMARY")
     print(f"   Total jobs scraped: {len(all_jobs)}")
-    print(f"   After processing: {len(cleaned_jobs)}")
-    print(f"   Contract relevance: {len(cleaned_jobs)/len(all_jobs)*100:.1f}%")
+    print(f"   After processing: {len(processed_jobs)}")
+    print(f"   Contract relevance: {len(processed_jobs)/len(all_jobs)*100:.1f}%")
     print(f"\n📋 BY SOURCE:")
     for source, count in source_stats.items():
         print(f"   {source}: {count} jobs")
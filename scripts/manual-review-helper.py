@@ -4,17 +4,24 @@ Manual Review Helper for ContractsOnly Job Verification
 This tool helps you review jobs flagged for manual verification.
 """
 
-import json
 import sys
 import webbrowser
 from datetime import datetime
 
+import orjson
+
+DECISIONS_PATH = '/root/contracts-only/scripts/manual-review-decisions.json'
+
+# Decisions are kept in memory for the session, written every few reviews for
+# crash safety, and once more when the session ends
+DECISIONS_CHECKPOINT_EVERY = 10
+
 def load_verification_results():
     """Load the latest verification results"""
     try:
         # Try to load from the verification output (if piped from enhanced-job-verifier.py)
-        with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'r') as f:
-            return json.load(f)
+        with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print("❌ No verification results found. Run enhanced-job-verifier.py first.")
         sys.exit(1)
@@ -80,15 +87,29 @@ def get_user_decision():
         
         choice = input("\nYour decision (A/R/O/S): ").upper().strip()
         
-        if choice in ['A', 'R', 'S']:
+        if choice in {'A', 'R', 'S'}:
             return choice
         elif choice == 'O':
             return 'O'
         else:
             print("❌ Invalid choice. Please enter A, R, O, or S.")
 
-def save_manual_review_decision(job_url, decision, notes=""):
-    """Save the manual review decision"""
+def load_manual_review_decisions():
+    """Load previously saved manual review decisions"""
+    try:
+        with open(DECISIONS_PATH, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return []
+
+def write_manual_review_decisions(decisions):
+    """Write all manual review decisions to disk"""
+    with open(DECISIONS_PATH, 'wb') as f:
+        f.write(orjson.dumps(decisions, option=orjson.OPT_INDENT_2))
+    print(f"💾 Decisions saved to: manual-review-decisions.json ({len(decisions)} total)")
+
+def save_manual_review_decision(decisions, job_url, decision, notes=""):
+    """Record the manual review decision, checkpointing to disk every few reviews"""
     decision_record = {
         'url': job_url,
         'manual_decision': 'ACCEPT' if decision == 'A' else 'REJECT',
@@ -97,21 +118,12 @@ def save_manual_review_decision(job_url, decision, notes=""):
         'notes': notes
     }
     
-    # Load existing manual decisions
-    try:
-        with open('/root/contracts-only/scripts/manual-review-decisions.json', 'r') as f:
-            decisions = json.load(f)
-    except FileNotFoundError:
-        decisions = []
-    
-    # Add new decision
+    # Add new decision; it only reaches disk at the next checkpoint or when the session ends
     decisions.append(decision_record)
+    print(f"✅ Decision recorded: {decision_record['manual_decision']}")
     
-    # Save updated decisions
-    with open('/root/contracts-only/scripts/manual-review-decisions.json', 'w') as f:
-        json.dump(decisions, indent=2, fp=f)
-    
-    print(f"✅ Decision saved: {decision_record['manual_decision']}")
+    if len(decisions) % DECISIONS_CHECKPOINT_EVERY == 0:
+        write_manual_review_decisions(decisions)
 
 def main():
     """Main manual review process"""
@@ -122,8 +134,8 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1].endswith('.json'):
         verification_file = sys.argv[1]
         try:
-            with open(verification_file, 'r') as f:
-                verification_data = json.load(f)
+            with open(verification_file, 'rb') as f:
+                verification_data = orjson.loads(f.read())
             
             if 'results' in verification_data:
                 results = verification_data['results']
@@ -149,48 +161,54 @@ def main():
         
         print(f"📋 Found {len(manual_review_jobs)} jobs requiring manual review\n")
         
-        # Load original job data for context
+        # Load original job data for context, keeping only the jobs under review
+        needed_urls = {r['url'] for r in manual_review_jobs}
         try:
-            with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'r') as f:
-                jobs_data = json.load(f)
-                job_lookup = {job['job_url']: job for job in jobs_data}
+            with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'rb') as f:
+                jobs_data = orjson.loads(f.read())
+                job_lookup = {job['job_url']: job for job in jobs_data if job.get('job_url') in needed_urls}
         except FileNotFoundError:
             job_lookup = {}
         
         # Review each job
-        for i, result in enumerate(manual_review_jobs, 1):
-            print(f"\n🔍 REVIEWING JOB {i} of {len(manual_review_jobs)}")
-            
-            job_url = result['url']
-            job_data = job_lookup.get(job_url, {'job_url': job_url})
-            
-            display_job_for_review(job_data, result)
-            
-            decision = get_user_decision()
-            
-            if decision == 'O':
-                try:
-                    webbrowser.open(job_url)
-                    print(f"🌐 Opened {job_url} in browser")
-                    decision = get_user_decision()  # Ask again after they review
-                except Exception as e:
-                    print(f"❌ Could not open browser: {e}")
-                    decision = get_user_decision()
-            
-            if decision == 'S':
-                print("⏭️  Skipped - you can review this job later")
-                continue
-            
-            # Get optional notes
-            notes = input("📝 Add notes (optional): ").strip()
-            
-            # Save decision
-            save_manual_review_decision(job_url, decision, notes)
-            
-            print(f"\n✅ Job {i} review completed")
+        decisions = load_manual_review_decisions()
+        saved_count = len(decisions)
+        try:
+            for i, result in enumerate(manual_review_jobs, 1):
+                print(f"\n🔍 REVIEWING JOB {i} of {len(manual_review_jobs)}")
+                
+                job_url = result['url']
+                job_data = job_lookup.get(job_url, {'job_url': job_url})
+                
+                display_job_for_review(job_data, result)
+                
+                decision = get_user_decision()
+                
+                if decision == 'O':
+                    try:
+                        webbrowser.open(job_url)
+                        print(f"🌐 Opened {job_url} in browser")
+                        decision = get_user_decision()  # Ask again after they review
+                    except Exception as e:
+                        print(f"❌ Could not open browser: {e}")
+                        decision = get_user_decision()
+                
+                if decision == 'S':
+                    print("⏭️  Skipped - you can review this job later")
+                    continue
+                
+                # Get optional notes
+                notes = input("📝 Add notes (optional): ").strip()
+                
+                # Record decision
+                save_manual_review_decision(decisions, job_url, decision, notes)
+                
+                print(f"\n✅ Job {i} review completed")
+        finally:
+            if len(decisions) > saved_count:
+                write_manual_review_decisions(decisions)
     
     print(f"\n🎉 Manual review session completed!")
-    print(f"📁 Decisions saved to: manual-review-decisions.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
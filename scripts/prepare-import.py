@@ -3,35 +3,41 @@
 Prepare accepted jobs for database import
 """
 
-import json
+import orjson
+import pandas as pd
 
-# Load original scraped data
-with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'r') as f:
-    scraped_jobs = json.load(f)
+# Fields added to each accepted job from its verification result
+VERIFICATION_FIELDS = ['verification_score', 'verification_method', 'verified_at']
 
-# Create a mapping from URL to original job data
-job_map = {job['job_url']: job for job in scraped_jobs}
+# Load original scraped data (dtype=object keeps the values exactly as loaded)
+with open('/root/contracts-only/scripts/temp-scraped-jobs.json', 'rb') as f:
+    scraped_jobs = pd.DataFrame(orjson.loads(f.read()), dtype=object)
 
 # Load verification results
-with open('/root/contracts-only/scripts/verification-parsed.json', 'r') as f:
-    verification_data = json.load(f)
-
-# Extract accepted jobs
-accepted_jobs = []
-for result in verification_data['results']:
-    if result['recommendation'] == 'ACCEPT':
-        url = result['url']
-        if url in job_map:
-            # Get original job data and add verification metadata
-            job = job_map[url].copy()
-            job['verification_score'] = result['final_score']
-            job['verification_method'] = result['verification_method']
-            job['verified_at'] = result['verified_at']
-            accepted_jobs.append(job)
+with open('/root/contracts-only/scripts/verification-parsed.json', 'rb') as f:
+    verification_data = orjson.loads(f.read())
+
+results = pd.DataFrame(
+    verification_data['results'],
+    columns=['url', 'recommendation', 'final_score', 'verification_method', 'verified_at']
+)
+
+# Extract accepted jobs: join their verification metadata onto the original
+# job data (a later duplicate of a URL wins, as with a URL -> job mapping)
+accepted_results = results[results['recommendation'] == 'ACCEPT'].rename(
+    columns={'url': 'job_url', 'final_score': 'verification_score'}
+)[['job_url', *VERIFICATION_FIELDS]]
+job_columns = [c for c in scraped_jobs.columns if c not in VERIFICATION_FIELDS]
+accepted = accepted_results.merge(
+    scraped_jobs.drop_duplicates(subset='job_url', keep='last')[job_columns],
+    on='job_url',
+    how='inner'
+)
+accepted_jobs = accepted[[*job_columns, *VERIFICATION_FIELDS]].to_dict('records')
 
 # Save accepted jobs for import
-with open('/root/contracts-only/scripts/accepted-jobs.json', 'w') as f:
-    json.dump(accepted_jobs, f, indent=2)
+with open('/root/contracts-only/scripts/accepted-jobs.json', 'wb') as f:
+    f.write(orjson.dumps(accepted_jobs, option=orjson.OPT_INDENT_2))
 
 print("=" * 60)
 print("📦 JOBS READY FOR DATABASE IMPORT")
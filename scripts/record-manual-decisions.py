@@ -3,9 +3,10 @@
 Record manual review decisions for the 2 jobs that need human verification
 """
 
-import json
 from datetime import datetime
 
+import orjson
+
 def record_decisions():
     # The 2 jobs that need manual review
     jobs_to_review = [
@@ -40,7 +41,7 @@ def record_decisions():
         
         while True:
             decision = input(f"Decision for Job #{i} (ACCEPT/REJECT): ").upper().strip()
-            if decision in ['ACCEPT', 'REJECT']:
+            if decision in {'ACCEPT', 'REJECT'}:
                 break
             print("❌ Please enter ACCEPT or REJECT")
         
@@ -60,12 +61,12 @@ def record_decisions():
         print("-" * 40)
     
     # Save decisions
-    with open('manual-review-decisions.json', 'w') as f:
-        json.dump({
+    with open('manual-review-decisions.json', 'wb') as f:
+        f.write(orjson.dumps({
             'decisions': decisions,
             'total_reviewed': len(decisions),
             'session_completed_at': datetime.now().isoformat()
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2))
     
     print(f"💾 All decisions saved to: manual-review-decisions.json")
     
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the Crawl4AI verifier's extraction patterns
+Checks that the RE2 and stdlib re engines extract the same values from pages
+containing NBSP and other Unicode whitespace
+"""
+
+import importlib.util
+import os
+import sys
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Page snippets with the whitespace scraped pages actually contain
+SAMPLES = [
+    ("$50\xa0-\xa0$70/hr", "$50 - $70/hr"),
+    ("Pay: $85\xa0/\xa0hour", "$85 / hour"),
+    ("Rate 45\u2009-\u200960 hourly", "45 - 60 hour"),
+    ("6\xa0months contract", "6 month"),
+    ("Job\xa0type:\xa0Contract, remote", "contract"),
+]
+
+def load_verifier_module():
+    """Import crawl4ai-job-verifier.py, whose file name is not a valid module name"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crawl4ai-job-verifier.py')
+    spec = importlib.util.spec_from_file_location('crawl4ai_job_verifier', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def extract_all(module, engine):
+    """Extract job type, hourly rate and duration from every sample with one engine"""
+    module.re2 = engine
+    verifier = module.Crawl4AIJobVerifier()
+    extracted = []
+    for text, _ in SAMPLES:
+        result = verifier._analyze_content('https://example.com/job', text)
+        extracted.append((result.job_type_found, result.hourly_rate, result.duration))
+    return extracted
+
+def test_nbsp_extraction():
+    """Test that both engines extract the expected values from Unicode-spaced text"""
+    module = load_verifier_module()
+    engines = [('re', None)] + ([('re2', re2)] if re2 is not None else [])
+    
+    passed = True
+    for name, engine in engines:
+        for (text, expected), values in zip(SAMPLES, extract_all(module, engine)):
+            if expected not in values:
+                print(f"❌ {name}: expected {expected!r} from {text!r}, got {values}")
+                passed = False
+    
+    if re2 is None:
+        print("ℹ️ re2 not installed; only the stdlib engine was checked")
+    return passed
+
+if __name__ == "__main__":
+    print("Crawl4AI Pattern Testing")
+    print("=" * 40)
+    
+    nbsp_test = test_nbsp_extraction()
+    
+    print(f"NBSP extraction test: {'PASSED' if nbsp_test else 'FAILED'}")
+    sys.exit(0 if nbsp_test else 1)